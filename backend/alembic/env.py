@@ -15,7 +15,10 @@ from app.db.models import Base
 
 config = context.config
 
-config.set_main_option("sqlalchemy.url", settings.DATABASE_URL.replace("+asyncpg", ""))
+config.set_main_option(
+    "sqlalchemy.url",
+    settings.DATABASE_URL.replace("+asyncpg", "").replace("+aiosqlite", ""),
+)
 
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
@@ -0,0 +1,34 @@
+"""Add escalation queue indexes
+
+Revision ID: 003_escalation_indexes
+Revises: 002_document_ids
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '003_escalation_indexes'
+down_revision = '002_document_ids'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'idx_escalations_status_priority_created',
+        'escalations',
+        ['status', sa.text('priority DESC'), 'created_at'],
+        postgresql_include=['conversation_id', 'assigned_to_id'],
+    )
+    # Enum columns store member names, hence 'PENDING'
+    op.create_index(
+        'idx_escalations_pending_priority',
+        'escalations',
+        ['priority'],
+        postgresql_where=sa.text("status = 'PENDING'"),
+        sqlite_where=sa.text("status = 'PENDING'"),
+    )
+
+
+def downgrade():
+    op.drop_index('idx_escalations_pending_priority', table_name='escalations')
+    op.drop_index('idx_escalations_status_priority_created', table_name='escalations')
@@ -0,0 +1,117 @@
+"""Store GUIDs as native UUID (PostgreSQL) or BINARY(16)
+
+Revision ID: 004_native_guids
+Revises: 003_escalation_indexes
+"""
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = '004_native_guids'
+down_revision = '003_escalation_indexes'
+branch_labels = None
+depends_on = None
+
+
+GUID_COLUMNS = {
+    'organizations': ['id'],
+    'users': ['id', 'organization_id'],
+    'departments': ['id', 'organization_id'],
+    'chatbots': ['id', 'organization_id'],
+    'chatbot_department': ['chatbot_id', 'department_id'],
+    'knowledge_documents': ['id', 'organization_id', 'department_id'],
+    'knowledge_chunks': ['id', 'document_id'],
+    'agent_pipelines': ['id', 'organization_id'],
+    'agent_runs': ['id', 'pipeline_id'],
+    'conversations': ['id', 'organization_id', 'chatbot_id', 'customer_id'],
+    'messages': ['id', 'conversation_id', 'edited_by_id'],
+    'escalations': ['id', 'conversation_id', 'message_id', 'assigned_to_id'],
+}
+
+
+def upgrade():
+    bind = op.get_bind()
+    
+    if bind.dialect.name == 'postgresql':
+        # Referenced and referencing columns must change type together,
+        # so drop the foreign keys around the ALTERs.
+        inspector = sa.inspect(bind)
+        foreign_keys = [
+            (table, fk)
+            for table in GUID_COLUMNS
+            for fk in inspector.get_foreign_keys(table)
+        ]
+        for table, fk in foreign_keys:
+            op.drop_constraint(fk['name'], table, type_='foreignkey')
+        
+        for table, columns in GUID_COLUMNS.items():
+            for column in columns:
+                op.alter_column(
+                    table, column,
+                    type_=postgresql.UUID(as_uuid=True),
+                    postgresql_using=f'{column}::uuid',
+                )
+        
+        for table, fk in foreign_keys:
+            op.create_foreign_key(
+                fk['name'], table, fk['referred_table'],
+                fk['constrained_columns'], fk['referred_columns'],
+                **fk.get('options', {}),
+            )
+        return
+    
+    # SQLite keeps whatever is stored regardless of the declared type,
+    # so rewrite the 32-char hex strings as 16-byte blobs in place.
+    for table, columns in GUID_COLUMNS.items():
+        for column in columns:
+            values = bind.execute(
+                sa.text(f"SELECT DISTINCT {column} FROM {table} WHERE typeof({column}) = 'text'")
+            ).scalars().all()
+            for value in values:
+                bind.execute(
+                    sa.text(f"UPDATE {table} SET {column} = :new WHERE {column} = :old"),
+                    {"new": uuid.UUID(value).bytes, "old": value},
+                )
+
+
+def downgrade():
+    bind = op.get_bind()
+    
+    if bind.dialect.name == 'postgresql':
+        inspector = sa.inspect(bind)
+        foreign_keys = [
+            (table, fk)
+            for table in GUID_COLUMNS
+            for fk in inspector.get_foreign_keys(table)
+        ]
+        for table, fk in foreign_keys:
+            op.drop_constraint(fk['name'], table, type_='foreignkey')
+        
+        for table, columns in GUID_COLUMNS.items():
+            for column in columns:
+                op.alter_column(
+                    table, column,
+                    type_=sa.CHAR(32),
+                    postgresql_using=f"replace({column}::text, '-', '')",
+                )
+        
+        for table, fk in foreign_keys:
+            op.create_foreign_key(
+                fk['name'], table, fk['referred_table'],
+                fk['constrained_columns'], fk['referred_columns'],
+                **fk.get('options', {}),
+            )
+        return
+    
+    for table, columns in GUID_COLUMNS.items():
+        for column in columns:
+            values = bind.execute(
+                sa.text(f"SELECT DISTINCT {column} FROM {table} WHERE typeof({column}) = 'blob'")
+            ).scalars().all()
+            for value in values:
+                bind.execute(
+                    sa.text(f"UPDATE {table} SET {column} = :new WHERE {column} = :old"),
+                    {"new": uuid.UUID(bytes=value).hex, "old": value},
+                )
@@ -0,0 +1,32 @@
+"""Add (conversation_id, created_at DESC) index on messages
+
+Revision ID: 005_messages_conv_created
+Revises: 004_native_guids
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '005_messages_conv_created'
+down_revision = '004_native_guids'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_messages_conv_created',
+            'messages',
+            ['conversation_id', sa.text('created_at DESC')],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_messages_conv_created',
+            table_name='messages',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,39 @@
+"""Add partial indexes for open escalations and active conversations
+
+Revision ID: 006_open_partial_indexes
+Revises: 005_messages_conv_created
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '006_open_partial_indexes'
+down_revision = '005_messages_conv_created'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Enum columns store member names, hence the upper-case literals
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_escalations_open',
+            'escalations',
+            ['assigned_to_id', 'priority', 'created_at'],
+            postgresql_where=sa.text("status IN ('PENDING', 'IN_REVIEW')"),
+            sqlite_where=sa.text("status IN ('PENDING', 'IN_REVIEW')"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_conversations_active',
+            'conversations',
+            ['organization_id', sa.text('updated_at DESC')],
+            postgresql_where=sa.text("status = 'ACTIVE'"),
+            sqlite_where=sa.text("status = 'ACTIVE'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_conversations_active', table_name='conversations', postgresql_concurrently=True)
+        op.drop_index('ix_escalations_open', table_name='escalations', postgresql_concurrently=True)
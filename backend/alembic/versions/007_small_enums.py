@@ -0,0 +1,79 @@
+"""Store enum columns as SMALLINT codes outside PostgreSQL
+
+Revision ID: 007_small_enums
+Revises: 006_open_partial_indexes
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '007_small_enums'
+down_revision = '006_open_partial_indexes'
+branch_labels = None
+depends_on = None
+
+
+# Member names in definition order; the list position is the stored code
+USER_ROLE = ['ADMIN', 'SUPPORT', 'CUSTOMER']
+KNOWLEDGE_TYPE = ['FAQ', 'POLICY', 'TROUBLESHOOTING', 'SALES', 'GENERAL']
+PROCESSING_STATUS = ['PENDING', 'PROCESSING', 'COMPLETED', 'FAILED']
+CONVERSATION_STATUS = ['ACTIVE', 'ESCALATED', 'RESOLVED', 'CLOSED']
+ESCALATION_STATUS = ['PENDING', 'IN_REVIEW', 'RESOLVED', 'DISMISSED']
+
+ENUM_COLUMNS = [
+    ('users', 'role', USER_ROLE),
+    ('knowledge_documents', 'knowledge_type', KNOWLEDGE_TYPE),
+    ('knowledge_documents', 'processing_status', PROCESSING_STATUS),
+    ('knowledge_chunks', 'knowledge_type', KNOWLEDGE_TYPE),
+    ('conversations', 'status', CONVERSATION_STATUS),
+    ('escalations', 'status', ESCALATION_STATUS),
+]
+
+# Partial indexes whose predicates reference enum values
+PARTIAL_INDEXES = [
+    ('idx_escalations_pending_priority', 'escalations', ['priority'],
+     "status = {PENDING}", ESCALATION_STATUS),
+    ('ix_escalations_open', 'escalations', ['assigned_to_id', 'priority', 'created_at'],
+     "status IN ({PENDING}, {IN_REVIEW})", ESCALATION_STATUS),
+    ('ix_conversations_active', 'conversations', ['organization_id', 'updated_at DESC'],
+     "status = {ACTIVE}", CONVERSATION_STATUS),
+]
+
+
+def _recreate_partial_indexes(as_codes: bool):
+    for name, table, columns, predicate, members in PARTIAL_INDEXES:
+        values = {
+            member: (str(i) if as_codes else f"'{member}'")
+            for i, member in enumerate(members)
+        }
+        op.drop_index(name, table_name=table)
+        op.create_index(
+            name, table, [sa.text(c) for c in columns],
+            sqlite_where=sa.text(predicate.format(**values)),
+        )
+
+
+def upgrade():
+    # PostgreSQL keeps its native ENUM types
+    if op.get_bind().dialect.name == 'postgresql':
+        return
+    
+    for table, column, members in ENUM_COLUMNS:
+        cases = " ".join(f"WHEN '{m}' THEN {i}" for i, m in enumerate(members))
+        op.execute(
+            f"UPDATE {table} SET {column} = CASE {column} {cases} END "
+            f"WHERE {column} IS NOT NULL"
+        )
+    _recreate_partial_indexes(as_codes=True)
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        return
+    
+    for table, column, members in ENUM_COLUMNS:
+        cases = " ".join(f"WHEN {i} THEN '{m}'" for i, m in enumerate(members))
+        op.execute(
+            f"UPDATE {table} SET {column} = CASE CAST({column} AS INTEGER) {cases} END "
+            f"WHERE {column} IS NOT NULL"
+        )
+    _recreate_partial_indexes(as_codes=False)
@@ -0,0 +1,58 @@
+"""Store JSON columns as JSONB on PostgreSQL
+
+Revision ID: 008_jsonb_columns
+Revises: 007_small_enums
+"""
+from alembic import op
+
+revision = '008_jsonb_columns'
+down_revision = '007_small_enums'
+branch_labels = None
+depends_on = None
+
+
+JSON_COLUMNS = {
+    'organizations': ['settings'],
+    'departments': ['settings'],
+    'chatbots': ['document_ids'],
+    'knowledge_documents': ['structured_content', 'meta_data'],
+    'knowledge_chunks': ['meta_data'],
+    'agent_pipelines': ['config', 'agents'],
+    'agent_runs': ['input_data', 'output_data'],
+    'conversations': ['entities'],
+    'messages': ['sources'],
+}
+
+GIN_INDEXES = {
+    'ix_chatbots_document_ids_gin': ('chatbots', 'document_ids'),
+    'ix_messages_sources_gin': ('messages', 'sources'),
+}
+
+
+def upgrade():
+    # SQLite has no binary JSON type; its columns stay as they are
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table, columns in JSON_COLUMNS.items():
+        for column in columns:
+            op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb')
+    
+    for name, (table, column) in GIN_INDEXES.items():
+        op.create_index(
+            name, table, [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'jsonb_path_ops'},
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for name, (table, _) in GIN_INDEXES.items():
+        op.drop_index(name, table_name=table)
+    
+    for table, columns in JSON_COLUMNS.items():
+        for column in columns:
+            op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} TYPE json USING {column}::json')
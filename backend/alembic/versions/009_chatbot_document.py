@@ -0,0 +1,91 @@
+"""Replace chatbots.document_ids with a chatbot_document association table
+
+Revision ID: 009_chatbot_document
+Revises: 008_jsonb_columns
+"""
+import json
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = '009_chatbot_document'
+down_revision = '008_jsonb_columns'
+branch_labels = None
+depends_on = None
+
+
+def _guid(dialect_name):
+    if dialect_name == 'postgresql':
+        return postgresql.UUID(as_uuid=True)
+    return sa.BINARY(16)
+
+
+def upgrade():
+    bind = op.get_bind()
+    guid = _guid(bind.dialect.name)
+    
+    op.create_table(
+        'chatbot_document',
+        sa.Column('chatbot_id', guid, sa.ForeignKey('chatbots.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('document_id', guid, sa.ForeignKey('knowledge_documents.id', ondelete='CASCADE'), primary_key=True),
+    )
+    op.create_index('ix_chatbot_document_document_id', 'chatbot_document', ['document_id'])
+    
+    # Ids of documents that were deleted since being attached are skipped
+    if bind.dialect.name == 'postgresql':
+        op.execute("""
+            INSERT INTO chatbot_document (chatbot_id, document_id)
+            SELECT c.id, d.value::uuid
+            FROM chatbots c, jsonb_array_elements_text(c.document_ids) AS d(value)
+            WHERE d.value::uuid IN (SELECT id FROM knowledge_documents)
+            ON CONFLICT DO NOTHING
+        """)
+        op.drop_index('ix_chatbots_document_ids_gin', table_name='chatbots')
+    else:
+        existing = set(bind.execute(sa.text("SELECT id FROM knowledge_documents")).scalars().all())
+        pairs = set()
+        for chatbot_id, document_ids in bind.execute(sa.text("SELECT id, document_ids FROM chatbots")):
+            for document_id in json.loads(document_ids or '[]'):
+                document_id = uuid.UUID(document_id).bytes
+                if document_id in existing:
+                    pairs.add((chatbot_id, document_id))
+        if pairs:
+            bind.execute(
+                sa.text("INSERT INTO chatbot_document (chatbot_id, document_id) VALUES (:c, :d)"),
+                [{"c": c, "d": d} for c, d in pairs],
+            )
+    
+    op.drop_column('chatbots', 'document_ids')
+
+
+def downgrade():
+    bind = op.get_bind()
+    
+    if bind.dialect.name == 'postgresql':
+        op.add_column('chatbots', sa.Column('document_ids', postgresql.JSONB(), nullable=True))
+        op.execute("""
+            UPDATE chatbots c SET document_ids = COALESCE(
+                (SELECT jsonb_agg(cd.document_id::text) FROM chatbot_document cd WHERE cd.chatbot_id = c.id),
+                '[]'::jsonb
+            )
+        """)
+        op.create_index(
+            'ix_chatbots_document_ids_gin', 'chatbots', ['document_ids'],
+            postgresql_using='gin',
+            postgresql_ops={'document_ids': 'jsonb_path_ops'},
+        )
+    else:
+        op.add_column('chatbots', sa.Column('document_ids', sa.JSON(), nullable=True))
+        grouped = {}
+        for chatbot_id, document_id in bind.execute(sa.text("SELECT chatbot_id, document_id FROM chatbot_document")):
+            grouped.setdefault(chatbot_id, []).append(str(uuid.UUID(bytes=document_id)))
+        for chatbot_id in bind.execute(sa.text("SELECT id FROM chatbots")).scalars().all():
+            bind.execute(
+                sa.text("UPDATE chatbots SET document_ids = :ids WHERE id = :id"),
+                {"ids": json.dumps(grouped.get(chatbot_id, [])), "id": chatbot_id},
+            )
+    
+    op.drop_index('ix_chatbot_document_document_id', table_name='chatbot_document')
+    op.drop_table('chatbot_document')
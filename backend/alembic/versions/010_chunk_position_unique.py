@@ -0,0 +1,50 @@
+"""Make (document_id, chunk_index) unique on knowledge_chunks
+
+Revision ID: 010_chunk_position_unique
+Revises: 009_chatbot_document
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '010_chunk_position_unique'
+down_revision = '009_chatbot_document'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Reprocessing used to append a second set of chunks; keep only the newest
+    op.execute("""
+        DELETE FROM knowledge_chunks
+        WHERE EXISTS (
+            SELECT 1 FROM knowledge_chunks newer
+            WHERE newer.document_id = knowledge_chunks.document_id
+              AND newer.chunk_index = knowledge_chunks.chunk_index
+              AND (newer.created_at > knowledge_chunks.created_at
+                   OR (newer.created_at = knowledge_chunks.created_at AND newer.id > knowledge_chunks.id))
+        )
+    """)
+    
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("UPDATE knowledge_chunks SET chunk_index = 0 WHERE chunk_index IS NULL")
+        op.alter_column('knowledge_chunks', 'chunk_index', nullable=False, server_default=None)
+        with op.get_context().autocommit_block():
+            op.create_index(
+                'uq_chunks_doc_idx', 'knowledge_chunks', ['document_id', 'chunk_index'],
+                unique=True, postgresql_concurrently=True,
+            )
+        op.execute(
+            "ALTER TABLE knowledge_chunks ADD CONSTRAINT uq_chunks_doc_idx "
+            "UNIQUE USING INDEX uq_chunks_doc_idx"
+        )
+    else:
+        # SQLite cannot add constraints to an existing table; a unique index is equivalent
+        op.create_index('uq_chunks_doc_idx', 'knowledge_chunks', ['document_id', 'chunk_index'], unique=True)
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_constraint('uq_chunks_doc_idx', 'knowledge_chunks', type_='unique')
+        op.alter_column('knowledge_chunks', 'chunk_index', nullable=True)
+    else:
+        op.drop_index('uq_chunks_doc_idx', table_name='knowledge_chunks')
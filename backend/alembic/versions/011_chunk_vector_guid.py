@@ -0,0 +1,60 @@
+"""Store knowledge_chunks.vector_id as a GUID
+
+Revision ID: 011_chunk_vector_guid
+Revises: 010_chunk_position_unique
+"""
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = '011_chunk_vector_guid'
+down_revision = '010_chunk_position_unique'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    
+    if bind.dialect.name == 'postgresql':
+        op.alter_column(
+            'knowledge_chunks', 'vector_id',
+            type_=postgresql.UUID(as_uuid=True),
+            postgresql_using='vector_id::uuid',
+        )
+    else:
+        # SQLite keeps the declared VARCHAR; rewrite the values as 16-byte blobs
+        values = bind.execute(
+            sa.text("SELECT id, vector_id FROM knowledge_chunks WHERE typeof(vector_id) = 'text'")
+        ).all()
+        for chunk_id, vector_id in values:
+            bind.execute(
+                sa.text("UPDATE knowledge_chunks SET vector_id = :new WHERE id = :id"),
+                {"new": uuid.UUID(vector_id).bytes, "id": chunk_id},
+            )
+    
+    op.create_index('uq_knowledge_chunks_vector_id', 'knowledge_chunks', ['vector_id'], unique=True)
+
+
+def downgrade():
+    bind = op.get_bind()
+    
+    op.drop_index('uq_knowledge_chunks_vector_id', table_name='knowledge_chunks')
+    
+    if bind.dialect.name == 'postgresql':
+        op.alter_column(
+            'knowledge_chunks', 'vector_id',
+            type_=sa.String(255),
+            postgresql_using='vector_id::text',
+        )
+    else:
+        values = bind.execute(
+            sa.text("SELECT id, vector_id FROM knowledge_chunks WHERE typeof(vector_id) = 'blob'")
+        ).all()
+        for chunk_id, vector_id in values:
+            bind.execute(
+                sa.text("UPDATE knowledge_chunks SET vector_id = :new WHERE id = :id"),
+                {"new": str(uuid.UUID(bytes=vector_id)), "id": chunk_id},
+            )
@@ -0,0 +1,90 @@
+"""Store messages.role and escalations.reason as enums
+
+Revision ID: 012_message_role_escalation_reason
+Revises: 011_chunk_vector_guid
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = '012_message_role_escalation_reason'
+down_revision = '011_chunk_vector_guid'
+branch_labels = None
+depends_on = None
+
+
+# Lower-case stored value -> member name, in definition order (list position is the code)
+MESSAGE_ROLE = [('user', 'USER'), ('assistant', 'ASSISTANT'), ('system', 'SYSTEM'), ('tool', 'TOOL')]
+ESCALATION_REASON = [
+    ('low_confidence', 'LOW_CONFIDENCE'),
+    ('processing_error', 'PROCESSING_ERROR'),
+    ('customer_request', 'CUSTOMER_REQUEST'),
+    ('other', 'OTHER'),
+]
+
+# (table, column, enum type, members, column keeping free-text values or None)
+ENUM_COLUMNS = [
+    ('messages', 'role', 'messagerole', MESSAGE_ROLE, None),
+    ('escalations', 'reason', 'escalationreason', ESCALATION_REASON, 'reason_detail'),
+]
+
+
+def upgrade():
+    bind = op.get_bind()
+    
+    for table, column, type_name, members, detail_column in ENUM_COLUMNS:
+        known = ", ".join(f"'{value}'" for value, _ in members)
+        unknown = f"{column} IS NOT NULL AND {column} NOT IN ({known})"
+        
+        if detail_column:
+            # Free-text values that predate the enum become the last member;
+            # the original text is kept alongside it
+            op.add_column(table, sa.Column(detail_column, sa.Text(), nullable=True))
+            op.execute(f"UPDATE {table} SET {detail_column} = {column} WHERE {unknown}")
+        else:
+            invalid = bind.execute(sa.text(f"SELECT DISTINCT {column} FROM {table} WHERE {unknown}")).scalars().all()
+            if invalid:
+                raise RuntimeError(
+                    f"{table}.{column} has values outside {[value for value, _ in members]}: "
+                    f"{invalid}; fix those rows before running this migration"
+                )
+        
+        if bind.dialect.name == 'postgresql':
+            postgresql.ENUM(*[name for _, name in members], name=type_name).create(bind, checkfirst=True)
+            cases = " ".join(f"WHEN '{value}' THEN '{name}'" for value, name in members)
+            fallback = f" ELSE '{members[-1][1]}'" if detail_column else ""
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {type_name} "
+                f"USING (CASE {column} {cases}{fallback} END)::{type_name}"
+            )
+        else:
+            cases = " ".join(f"WHEN '{value}' THEN {i}" for i, (value, _) in enumerate(members))
+            fallback = f" ELSE {len(members) - 1}" if detail_column else ""
+            op.execute(
+                f"UPDATE {table} SET {column} = CASE {column} {cases}{fallback} END "
+                f"WHERE {column} IS NOT NULL"
+            )
+
+
+def downgrade():
+    bind = op.get_bind()
+    
+    for table, column, type_name, members, detail_column in ENUM_COLUMNS:
+        if bind.dialect.name == 'postgresql':
+            length = 50 if column == 'role' else 255
+            op.alter_column(
+                table, column,
+                type_=sa.String(length),
+                postgresql_using=f"lower({column}::text)",
+            )
+            postgresql.ENUM(name=type_name).drop(bind, checkfirst=True)
+        else:
+            cases = " ".join(f"WHEN {i} THEN '{value}'" for i, (value, _) in enumerate(members))
+            op.execute(
+                f"UPDATE {table} SET {column} = CASE CAST({column} AS INTEGER) {cases} END "
+                f"WHERE {column} IS NOT NULL"
+            )
+        
+        if detail_column:
+            op.execute(f"UPDATE {table} SET {column} = {detail_column} WHERE {detail_column} IS NOT NULL")
+            op.drop_column(table, detail_column)
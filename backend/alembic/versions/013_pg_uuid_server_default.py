@@ -0,0 +1,35 @@
+"""Default primary keys to gen_random_uuid() on PostgreSQL
+
+Revision ID: 013_pg_uuid_server_default
+Revises: 012_message_role_escalation_reason
+"""
+from alembic import op
+
+revision = '013_pg_uuid_server_default'
+down_revision = '012_message_role_escalation_reason'
+branch_labels = None
+depends_on = None
+
+
+TABLES = [
+    'organizations', 'users', 'departments', 'chatbots', 'knowledge_documents',
+    'knowledge_chunks', 'agent_pipelines', 'agent_runs', 'conversations',
+    'messages', 'escalations',
+]
+
+
+def upgrade():
+    # The ORM still supplies uuid7 ids; this only covers inserts that omit id
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
@@ -0,0 +1,58 @@
+"""Cascade parent deletes in the database
+
+Revision ID: 014_fk_on_delete_cascade
+Revises: 013_pg_uuid_server_default
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '014_fk_on_delete_cascade'
+down_revision = '013_pg_uuid_server_default'
+branch_labels = None
+depends_on = None
+
+
+# (table, column, referred table)
+CASCADE_FKS = [
+    ('departments', 'organization_id', 'organizations'),
+    ('chatbots', 'organization_id', 'organizations'),
+    ('knowledge_documents', 'organization_id', 'organizations'),
+    ('knowledge_chunks', 'document_id', 'knowledge_documents'),
+    ('agent_pipelines', 'organization_id', 'organizations'),
+    ('agent_runs', 'pipeline_id', 'agent_pipelines'),
+    ('conversations', 'organization_id', 'organizations'),
+    ('messages', 'conversation_id', 'conversations'),
+    ('escalations', 'conversation_id', 'conversations'),
+]
+
+# SQLite reflects its foreign keys unnamed; name them so batch mode can drop them
+SQLITE_NAMING = {"fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s"}
+
+
+def _replace_foreign_keys(ondelete):
+    bind = op.get_bind()
+    
+    if bind.dialect.name == 'postgresql':
+        inspector = sa.inspect(bind)
+        for table, column, referred in CASCADE_FKS:
+            for fk in inspector.get_foreign_keys(table):
+                if fk['constrained_columns'] == [column]:
+                    op.drop_constraint(fk['name'], table, type_='foreignkey')
+                    op.create_foreign_key(
+                        fk['name'], table, referred, [column], ['id'], ondelete=ondelete,
+                    )
+        return
+    
+    for table, column, referred in CASCADE_FKS:
+        name = f"fk_{table}_{column}_{referred}"
+        with op.batch_alter_table(table, naming_convention=SQLITE_NAMING, recreate='always') as batch_op:
+            batch_op.drop_constraint(name, type_='foreignkey')
+            batch_op.create_foreign_key(name, referred, [column], ['id'], ondelete=ondelete)
+
+
+def upgrade():
+    _replace_foreign_keys(ondelete='CASCADE')
+
+
+def downgrade():
+    _replace_foreign_keys(ondelete=None)
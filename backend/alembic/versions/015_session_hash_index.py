@@ -0,0 +1,54 @@
+"""Hash-index conversations.session_id and shrink it to VARCHAR(64)
+
+Revision ID: 015_session_hash_index
+Revises: 014_fk_on_delete_cascade
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '015_session_hash_index'
+down_revision = '014_fk_on_delete_cascade'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    is_postgres = bind.dialect.name == 'postgresql'
+    
+    # Refuse to narrow the column over longer ids rather than truncating them,
+    # which could merge distinct sessions; checked before any index changes
+    if is_postgres:
+        too_long = bind.execute(sa.text(
+            "SELECT id, length(session_id) FROM conversations"
+            " WHERE length(session_id) > 64 ORDER BY id LIMIT 20"
+        )).all()
+        if too_long:
+            rows = ", ".join(f"{conv_id} ({length} chars)" for conv_id, length in too_long)
+            raise RuntimeError(
+                "conversations.session_id must be at most 64 characters before this "
+                f"migration can run; shorten or remove them first (up to 20 shown): {rows}"
+            )
+    
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_conversations_session_hash', 'conversations', ['session_id'],
+            postgresql_using='hash', postgresql_concurrently=True,
+        )
+        op.drop_index('ix_conversations_session_id', table_name='conversations', postgresql_concurrently=True)
+    
+    # SQLite ignores VARCHAR lengths
+    if is_postgres:
+        op.alter_column('conversations', 'session_id', type_=sa.String(64))
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.alter_column('conversations', 'session_id', type_=sa.String(255))
+    
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_conversations_session_id', 'conversations', ['session_id'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index('ix_conversations_session_hash', table_name='conversations', postgresql_concurrently=True)
@@ -0,0 +1,46 @@
+"""Allow at most one pending escalation per conversation
+
+Revision ID: 016_pending_escalation_unique
+Revises: 015_session_hash_index
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '016_pending_escalation_unique'
+down_revision = '015_session_hash_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    is_postgres = op.get_bind().dialect.name == 'postgresql'
+    # Native enum labels on PostgreSQL, definition-order codes elsewhere
+    pending, dismissed = ("'PENDING'", "'DISMISSED'") if is_postgres else ("0", "3")
+
+    # Keep the newest pending escalation per conversation, dismiss the rest
+    op.execute(f"""
+        UPDATE escalations SET status = {dismissed}
+        WHERE status = {pending} AND EXISTS (
+            SELECT 1 FROM escalations newer
+            WHERE newer.conversation_id = escalations.conversation_id
+              AND newer.status = {pending}
+              AND (newer.created_at, newer.id) > (escalations.created_at, escalations.id)
+        )
+    """)
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_escalations_pending_conversation', 'escalations', ['conversation_id'],
+            unique=True,
+            postgresql_where=sa.text(f"status = {pending}"),
+            sqlite_where=sa.text(f"status = {pending}"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'uq_escalations_pending_conversation', table_name='escalations',
+            postgresql_concurrently=True,
+        )
@@ -1,5 +1,10 @@
+import csv
+import io
+import mmap
+import os
 import uuid
-from typing import TypedDict, Optional, List, Dict, Any, Annotated
+from functools import lru_cache
+from typing import TypedDict, Optional, List, Dict, Any, Annotated, Tuple
 import operator
 import structlog
 
@@ -8,9 +13,6 @@ from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_core.documents import Document
-from langchain_community.document_loaders import (
-    PyPDFLoader, Docx2txtLoader, TextLoader, CSVLoader
-)
 
 from app.core.config import settings
 from app.agents.vector_store import VectorStoreManager
@@ -18,6 +20,77 @@ from app.agents.vector_store import VectorStoreManager
 logger = structlog.get_logger()
 
 
+# Loader classes are imported on first use of each file type, so workers that
+# never ingest a given format never pay for its parser imports
+@lru_cache(maxsize=None)
+def _pdf_loader_cls():
+    from langchain_community.document_loaders import PyPDFLoader
+    return PyPDFLoader
+
+
+@lru_cache(maxsize=None)
+def _docx_loader_cls():
+    from langchain_community.document_loaders import Docx2txtLoader
+    return Docx2txtLoader
+
+
+# txt and csv are read directly by read_text()
+LOADERS = {
+    "pdf": _pdf_loader_cls,
+    "docx": _docx_loader_cls,
+}
+
+
+def get_loader(file_path: str, file_type: str):
+    """Get appropriate document loader"""
+    loader_factory = LOADERS.get(file_type)
+    if not loader_factory:
+        raise ValueError(f"Unsupported file type: {file_type}")
+    return loader_factory()(file_path)
+
+
+def _csv_row_text(row: Dict[Optional[str], Any]) -> str:
+    # Same "column: value" layout CSVLoader gives each row
+    lines = []
+    for key, value in row.items():
+        if isinstance(value, str):
+            value = value.strip()
+        elif isinstance(value, list):
+            value = ",".join(v.strip() for v in value)
+        lines.append(f"{key.strip() if key is not None else key}: {value}")
+    return "\n".join(lines)
+
+
+def read_text(file_path: str, file_type: str) -> Optional[Tuple[str, int]]:
+    """
+    Read a txt/csv file without a LangChain loader. Text files are read as-is;
+    CSV rows are streamed from an mmap and written into one buffer as they are
+    parsed, so no per-row strings or Documents are kept. Returns
+    (text, page_count), or None for types that need a LangChain loader.
+    """
+    if file_type == "txt":
+        with open(file_path, encoding="utf-8") as f:
+            return f.read(), 1
+    
+    if file_type != "csv":
+        return None
+    
+    # mmap cannot map an empty file
+    if os.path.getsize(file_path) == 0:
+        return "", 0
+    
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        buffer = io.StringIO()
+        row_count = 0
+        lines = (line.decode("utf-8") for line in iter(mm.readline, b""))
+        for row in csv.DictReader(lines):
+            if row_count:
+                buffer.write("\n\n")
+            buffer.write(_csv_row_text(row))
+            row_count += 1
+        return buffer.getvalue(), row_count
+
+
 class KnowledgeState(TypedDict):
     file_path: str
     file_type: str
@@ -91,32 +164,30 @@ class KnowledgeIngestionPipeline:
         file_path = state["file_path"]
         file_type = state["file_type"]
         
-        loaders = {
-            "pdf": PyPDFLoader,
-            "docx": Docx2txtLoader,
-            "txt": TextLoader,
-            "csv": CSVLoader,
-        }
-        
         try:
-            loader_class = loaders.get(file_type)
-            if not loader_class:
-                state["errors"] = [f"Unsupported file type: {file_type}"]
-                return state
-            
-            loader = loader_class(file_path)
-            documents = loader.load()
-            
-            raw_text = "\n\n".join([doc.page_content for doc in documents])
+            text = read_text(file_path, file_type)
+            if text is not None:
+                raw_text, page_count = text
+                documents = []
+            else:
+                try:
+                    loader = get_loader(file_path, file_type)
+                except ValueError as e:
+                    state["errors"] = [str(e)]
+                    return state
+                
+                documents = loader.load()
+                raw_text = "\n\n".join([doc.page_content for doc in documents])
+                page_count = len(documents)
             
             state["raw_documents"] = documents
             state["raw_text"] = raw_text
             state["metadata"] = {
-                "page_count": len(documents),
+                "page_count": page_count,
                 "total_chars": len(raw_text),
             }
             
-            logger.info("Loader agent completed", pages=len(documents))
+            logger.info("Loader agent completed", pages=page_count)
             
         except Exception as e:
             logger.error("Loader agent failed", error=str(e))
@@ -1,5 +1,9 @@
-from typing import TypedDict, Optional, List, Dict, Any
+from collections import OrderedDict
+from typing import TypedDict, Optional, List, Dict, Any, Tuple
+import hashlib
+import json
 import structlog
+from cachetools import TTLCache
 
 from langgraph.graph import StateGraph, END
 from langchain_openai import ChatOpenAI
@@ -7,14 +11,28 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 
 from app.core.config import settings
+from app.schemas import SourceRef
 from app.agents.vector_store import VectorStoreManager
 
 logger = structlog.get_logger()
 
+# Follow-up turns in a conversation tend to repeat the same knowledge search.
+# Each conversation keeps its last few (filter, query) -> results pairs; idle
+# conversations age out so newly ingested documents show up within the TTL.
+SEARCH_CACHE_SIZE = 5
+_search_cache: TTLCache = TTLCache(maxsize=10_000, ttl=15 * 60)
+
+
+def _search_key(search_filter: Dict[str, Any], query: str) -> str:
+    raw = json.dumps(search_filter, sort_keys=True) + "\0" + " ".join(query.lower().split())
+    return hashlib.sha1(raw.encode()).hexdigest()
+
 
 class SupportState(TypedDict):
     user_message: str
-    conversation_history: List[Dict[str, str]]
+    # (role, content) pairs, oldest first
+    conversation_history: List[Tuple[str, str]]
+    conversation_id: Optional[str]
     organization_id: str
     department: Optional[str]
     document_ids: Optional[List[str]]
@@ -27,7 +45,7 @@ class SupportState(TypedDict):
     response: str
     confidence_score: float
     
-    sources: List[Dict[str, Any]]
+    sources: List[SourceRef]
     should_escalate: bool
     agent_name: str
     langsmith_run_id: Optional[str]
@@ -90,8 +108,8 @@ class SupportAgentPipeline:
             ])
             
             context = "\n".join([
-                f"{msg['role']}: {msg['content']}" 
-                for msg in state.get("conversation_history", [])[-5:]
+                f"{role}: {content}"
+                for role, content in state.get("conversation_history", [])[-5:]
             ])
             
             chain = intent_prompt | self.llm
@@ -173,11 +191,7 @@ class SupportAgentPipeline:
             
             logger.info("Retriever filter", filter=search_filter)
             
-            results = await self.vector_store.similarity_search(
-                query=query,
-                k=5,
-                filter=search_filter
-            )
+            results = await self._cached_search(state.get("conversation_id"), query, search_filter)
             
             knowledge_context = []
             for doc, score in results:
@@ -192,10 +206,11 @@ class SupportAgentPipeline:
             
             state["knowledge_context"] = knowledge_context
             state["sources"] = [
-                {
-                    "document_id": ctx["metadata"].get("document_id"),
-                    "relevance": ctx["relevance_score"],
-                }
+                SourceRef(
+                    kind="chunk",
+                    document_id=ctx["metadata"].get("document_id"),
+                    score=ctx["relevance_score"],
+                )
                 for ctx in knowledge_context
             ]
             
@@ -208,6 +223,31 @@ class SupportAgentPipeline:
         
         return state
     
+    async def _cached_search(
+        self,
+        conversation_id: Optional[str],
+        query: str,
+        search_filter: Dict[str, Any],
+    ) -> list:
+        if not conversation_id:
+            return await self.vector_store.similarity_search(query=query, k=5, filter=search_filter)
+        
+        recent = _search_cache.get(conversation_id)
+        if recent is None:
+            recent = _search_cache[conversation_id] = OrderedDict()
+        
+        key = _search_key(search_filter, query)
+        if key in recent:
+            recent.move_to_end(key)
+            logger.info("Retriever cache hit", conversation_id=conversation_id)
+            return recent[key]
+        
+        results = await self.vector_store.similarity_search(query=query, k=5, filter=search_filter)
+        recent[key] = results
+        if len(recent) > SEARCH_CACHE_SIZE:
+            recent.popitem(last=False)
+        return results
+    
     async def reasoning_agent(self, state: SupportState) -> SupportState:
 
         logger.info("Reasoning agent processing")
@@ -243,8 +283,8 @@ Provide your reasoning:""")
             ]) or "No relevant knowledge found."
             
             history_text = "\n".join([
-                f"{msg['role']}: {msg['content']}"
-                for msg in state.get("conversation_history", [])[-3:]
+                f"{role}: {content}"
+                for role, content in state.get("conversation_history", [])[-3:]
             ]) or "No previous conversation."
             
             chain = reasoning_prompt | self.llm
@@ -394,17 +434,19 @@ Generate a helpful response (be direct, no formal sign-offs):""")
     async def run(
         self,
         user_message: str,
-        conversation_history: List[Dict[str, str]],
+        conversation_history: List[Tuple[str, str]],
         organization_id: str,
         department: Optional[str] = None,
         department_ids: Optional[List[str]] = None,
         document_ids: Optional[List[str]] = None,
         chatbot_config: Optional[Dict[str, Any]] = None,
+        conversation_id: Optional[str] = None,
     ) -> Dict[str, Any]:
        
         initial_state: SupportState = {
             "user_message": user_message,
             "conversation_history": conversation_history,
+            "conversation_id": conversation_id,
             "organization_id": organization_id,
             "department": department,
             "document_ids": document_ids,
@@ -1,4 +1,6 @@
+import asyncio
 import os
+import uuid
 from typing import List, Dict, Any, Optional
 import structlog
 
@@ -10,6 +12,11 @@ from app.core.config import settings
 
 logger = structlog.get_logger()
 
+# Texts per embeddings request; batches for one document are sent concurrently
+EMBED_BATCH_SIZE = 256
+# Embeddings requests in flight at once for one document
+EMBED_CONCURRENCY = 4
+
 
 class VectorStoreManager:
     
@@ -38,15 +45,60 @@ class VectorStoreManager:
             persist_directory=self.persist_directory,
         )
     
+    def _upsert(
+        self,
+        collection_name: str,
+        ids: List[str],
+        embeddings: List[List[float]],
+        metadatas: List[Dict[str, Any]],
+        texts: List[str],
+    ) -> None:
+        # Straight to the Chroma collection, so the wrapper doesn't embed again
+        collection = self._get_collection(collection_name)
+        collection._collection.upsert(
+            ids=ids,
+            embeddings=embeddings,
+            metadatas=metadatas,
+            documents=texts,
+        )
+    
     async def add_documents(
         self,
         documents: List[Document],
         collection_name: str = "knowledge"
     ) -> List[str]:
+        if not documents:
+            return []
+        
         try:
-            collection = self._get_collection(collection_name)
-            ids = collection.add_documents(documents)
+            texts = [doc.page_content for doc in documents]
+            
+            # Chroma would embed everything in one sequential blocking call;
+            # embed the batches concurrently and hand it the vectors instead
+            semaphore = asyncio.Semaphore(EMBED_CONCURRENCY)
+            
+            async def embed_batch(batch: List[str]) -> List[List[float]]:
+                async with semaphore:
+                    return await self.embeddings.aembed_documents(batch)
+            
+            batches = await asyncio.gather(*(
+                embed_batch(texts[i:i + EMBED_BATCH_SIZE])
+                for i in range(0, len(texts), EMBED_BATCH_SIZE)
+            ))
+            embeddings = [vector for batch in batches for vector in batch]
+            
+            ids = [str(uuid.uuid4()) for _ in documents]
+            # Opening the persistent collection and writing it are blocking disk I/O
+            await asyncio.to_thread(
+                self._upsert,
+                collection_name,
+                ids,
+                embeddings,
+                [doc.metadata for doc in documents],
+                texts,
+            )
             logger.info(
+                "Added documents",
                 count=len(documents),
                 collection=collection_name
             )
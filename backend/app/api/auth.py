@@ -2,7 +2,6 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
-import re
 
 from app.db import get_db, User, UserRole, Organization
 from app.schemas import UserCreate, UserLogin, UserResponse, TokenResponse
@@ -16,13 +15,6 @@ from app.core.security import (
 router = APIRouter()
 
 
-def create_slug(name: str) -> str:
-    slug = name.lower().strip()
-    slug = re.sub(r'[^\w\s-]', '', slug)
-    slug = re.sub(r'[-\s]+', '-', slug)
-    return slug
-
-
 @router.post("/register", response_model=TokenResponse)
 async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     result = await db.execute(select(User).where(User.email == user_data.email))
@@ -36,7 +28,7 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     
     user = User(
         email=user_data.email,
-        hashed_password=get_password_hash(user_data.password),
+        hashed_password=await get_password_hash(user_data.password),
         full_name=user_data.full_name,
         role=UserRole.CUSTOMER,
     )
@@ -65,7 +57,11 @@ async def login(credentials: UserLogin, db: AsyncSession = Depends(get_db)):
     )
     user = result.scalar_one_or_none()
     
-    if not user or not verify_password(credentials.password, user.hashed_password):
+    verified, new_hash = False, None
+    if user:
+        verified, new_hash = await verify_password(credentials.password, user.hashed_password)
+    
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
@@ -87,6 +83,10 @@ async def login(credentials: UserLogin, db: AsyncSession = Depends(get_db)):
     
     token = create_access_token(token_data)
     
+    if new_hash:
+        user.hashed_password = new_hash
+        await db.commit()
+    
     return TokenResponse(
         access_token=token,
         user=UserResponse.model_validate(user)
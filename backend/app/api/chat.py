@@ -1,30 +1,68 @@
 from typing import Optional
 from uuid import UUID
 import uuid
-from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect, Request
+from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect, Request, Response
+from fastapi.exceptions import RequestValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from pydantic import BaseModel
+from sqlalchemy.orm import selectinload
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
-from app.db import get_db, Conversation, Message, Organization, Chatbot, ConversationStatus
-from app.schemas import ChatMessage, ChatResponse, ConversationResponse, MessageResponse
+from app.db import get_db, Conversation, Message, MessageRole, Organization, Chatbot, ConversationStatus
+from app.schemas import ChatMessage, ChatResponse, ConversationResponse
 from app.core.security import get_current_user
 from app.core.rate_limiter import chat_rate_limit
 from app.services.chat_service import ChatService
 
 router = APIRouter()
 
+# Responses are built server-side from trusted rows, so they are dumped straight
+# to JSON rather than round-tripped through FastAPI's response_model validation
+_chat_response_adapter = TypeAdapter(ChatResponse)
+_conversation_adapter = TypeAdapter(ConversationResponse)
+_conversations_adapter = TypeAdapter(list[ConversationResponse])
+
+
+def _json_response(adapter: TypeAdapter, obj) -> Response:
+    return Response(content=adapter.dump_json(obj), media_type="application/json")
+
+
+def _json_body(model: type[BaseModel]):
+    """Dependency that validates the raw request body in one pydantic-core pass,
+    skipping FastAPI's json.loads-then-validate round trip through a dict."""
+    adapter = TypeAdapter(model)
+    
+    async def parse(request: Request):
+        try:
+            return adapter.validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError(
+                [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)]
+            )
+    
+    return parse
+
+
+def _body_schema(model: type[BaseModel]) -> dict:
+    """openapi_extra documenting a body that is parsed by _json_body"""
+    return {
+        "requestBody": {
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+            "required": True,
+        }
+    }
+
 
 class WidgetMessage(BaseModel):
     chatbot_id: UUID
-    session_id: str
+    session_id: str = Field(max_length=64)
     content: str
 
 
-@router.post("/widget-message")
+@router.post("/widget-message", openapi_extra=_body_schema(WidgetMessage))
 async def widget_send_message(
-    message: WidgetMessage,
     request: Request,
+    message: WidgetMessage = Depends(_json_body(WidgetMessage)),
     db: AsyncSession = Depends(get_db),
     _rate_limit: None = Depends(chat_rate_limit)
 ):
@@ -59,7 +97,7 @@ async def widget_send_message(
     
     user_msg = Message(
         conversation_id=conversation.id,
-        role="user",
+        role=MessageRole.USER,
         content=message.content,
     )
     db.add(user_msg)
@@ -81,10 +119,10 @@ async def widget_send_message(
     }
 
 
-@router.post("/message", response_model=ChatResponse)
+@router.post("/message", response_model=ChatResponse, openapi_extra=_body_schema(ChatMessage))
 async def send_message(
     organization_id: UUID,
-    message: ChatMessage,
+    message: ChatMessage = Depends(_json_body(ChatMessage)),
     db: AsyncSession = Depends(get_db)
 ):
     result = await db.execute(select(Organization).where(Organization.id == organization_id))
@@ -115,7 +153,7 @@ async def send_message(
     
     user_message = Message(
         conversation_id=conversation.id,
-        role="user",
+        role=MessageRole.USER,
         content=message.content,
     )
     db.add(user_message)
@@ -128,7 +166,7 @@ async def send_message(
         organization_id=str(organization_id)
     )
     
-    return response
+    return _json_response(_chat_response_adapter, response)
 
 
 @router.get("/conversations", response_model=list[ConversationResponse])
@@ -138,7 +176,7 @@ async def list_conversations(
     current_user: dict = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    query = select(Conversation).where(
+    query = select(Conversation).options(selectinload(Conversation.messages)).where(
         Conversation.organization_id == organization_id
     )
     
@@ -148,9 +186,11 @@ async def list_conversations(
     query = query.order_by(Conversation.updated_at.desc())
     
     result = await db.execute(query)
-    conversations = result.scalars().all()
+    conversations = _conversations_adapter.validate_python(
+        result.scalars().all(), from_attributes=True
+    )
     
-    return [ConversationResponse.model_validate(conv) for conv in conversations]
+    return _json_response(_conversations_adapter, conversations)
 
 
 @router.get("/conversations/{conversation_id}", response_model=ConversationResponse)
@@ -159,23 +199,17 @@ async def get_conversation(
     db: AsyncSession = Depends(get_db)
 ):
     result = await db.execute(
-        select(Conversation).where(Conversation.id == conversation_id)
+        select(Conversation).options(selectinload(Conversation.messages))
+        .where(Conversation.id == conversation_id)
     )
     conversation = result.scalar_one_or_none()
     
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
     
-    msg_result = await db.execute(
-        select(Message).where(Message.conversation_id == conversation_id)
-        .order_by(Message.created_at)
-    )
-    messages = msg_result.scalars().all()
+    conv_response = _conversation_adapter.validate_python(conversation, from_attributes=True)
     
-    conv_response = ConversationResponse.model_validate(conversation)
-    conv_response.messages = [MessageResponse.model_validate(msg) for msg in messages]
-    
-    return conv_response
+    return _json_response(_conversation_adapter, conv_response)
 
 
 @router.get("/conversations/session/{session_id}", response_model=ConversationResponse)
@@ -185,7 +219,7 @@ async def get_conversation_by_session(
     db: AsyncSession = Depends(get_db)
 ):
     result = await db.execute(
-        select(Conversation).where(
+        select(Conversation).options(selectinload(Conversation.messages)).where(
             Conversation.organization_id == organization_id,
             Conversation.session_id == session_id
         )
@@ -195,16 +229,9 @@ async def get_conversation_by_session(
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
     
-    msg_result = await db.execute(
-        select(Message).where(Message.conversation_id == conversation.id)
-        .order_by(Message.created_at)
-    )
-    messages = msg_result.scalars().all()
-    
-    conv_response = ConversationResponse.model_validate(conversation)
-    conv_response.messages = [MessageResponse.model_validate(msg) for msg in messages]
+    conv_response = _conversation_adapter.validate_python(conversation, from_attributes=True)
     
-    return conv_response
+    return _json_response(_conversation_adapter, conv_response)
 
 
 @router.post("/conversations/{conversation_id}/close")
@@ -5,10 +5,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 from pydantic import BaseModel, Field
-import re
 
-from app.db import get_db, Chatbot, Department, Organization, User
+from app.db import get_db, Chatbot, Department, KnowledgeDocument, Organization, User
+from app.schemas import ORMModel
 from app.core.security import get_current_user, require_admin
+from app.core.utils import create_slug
 
 router = APIRouter(redirect_slashes=False)
 
@@ -40,17 +41,15 @@ class ChatbotUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 
-class DepartmentBrief(BaseModel):
+class DepartmentBrief(ORMModel):
     id: UUID
     name: str
     slug: str
     description: Optional[str] = None
     document_count: int = 0
-    
-    model_config = {"from_attributes": True}
 
 
-class ChatbotResponse(BaseModel):
+class ChatbotResponse(ORMModel):
     id: UUID
     organization_id: UUID
     name: str
@@ -66,15 +65,6 @@ class ChatbotResponse(BaseModel):
     is_active: bool
     document_ids: List[UUID] = []
     departments: List[DepartmentBrief] = []
-    
-    model_config = {"from_attributes": True}
-
-
-def create_slug(name: str) -> str:
-    slug = name.lower().strip()
-    slug = re.sub(r'[^\w\s-]', '', slug)
-    slug = re.sub(r'[-\s]+', '-', slug)
-    return slug
 
 
 def get_user_id(current_user: dict) -> UUID:
@@ -119,9 +109,17 @@ async def create_chatbot(
         temperature=data.temperature,
         confidence_threshold=data.confidence_threshold,
         primary_color=data.primary_color,
-        document_ids=[str(d) for d in data.document_ids] if data.document_ids else [],
     )
     
+    if data.document_ids:
+        doc_result = await db.execute(
+            select(KnowledgeDocument).where(
+                KnowledgeDocument.id.in_(data.document_ids),
+                KnowledgeDocument.organization_id == organization_id
+            )
+        )
+        chatbot.documents = list(doc_result.scalars().all())
+    
     if data.department_ids:
         dept_result = await db.execute(
             select(Department).where(
@@ -134,7 +132,7 @@ async def create_chatbot(
     
     db.add(chatbot)
     await db.commit()
-    await db.refresh(chatbot, ["departments"])
+    await db.refresh(chatbot, ["departments", "documents"])
     
     return ChatbotResponse.model_validate(chatbot)
 
@@ -204,7 +202,13 @@ async def update_chatbot(
         setattr(chatbot, key, value)
     
     if document_ids is not None:
-        chatbot.document_ids = [str(d) for d in document_ids]
+        doc_result = await db.execute(
+            select(KnowledgeDocument).where(
+                KnowledgeDocument.id.in_(document_ids),
+                KnowledgeDocument.organization_id == chatbot.organization_id
+            )
+        )
+        chatbot.documents = list(doc_result.scalars().all())
     
     if department_ids is not None:
         dept_result = await db.execute(
@@ -217,7 +221,7 @@ async def update_chatbot(
         chatbot.departments = list(departments)
     
     await db.commit()
-    await db.refresh(chatbot, ["departments"])
+    await db.refresh(chatbot, ["departments", "documents"])
     
     return ChatbotResponse.model_validate(chatbot)
 
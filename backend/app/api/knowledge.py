@@ -2,9 +2,10 @@ from typing import List, Optional
 from uuid import UUID
 import os
 import aiofiles
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, BackgroundTasks, Request
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, BackgroundTasks, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from pydantic import TypeAdapter
 
 from app.db import get_db, KnowledgeDocument, KnowledgeChunk, Organization, Department, ProcessingStatus
 from app.schemas import KnowledgeUploadResponse, KnowledgeDocumentResponse, KnowledgeChunkResponse, KnowledgeType
@@ -18,6 +19,8 @@ router = APIRouter(redirect_slashes=False)
 # Max file size: 5MB for demo
 MAX_FILE_SIZE = 5 * 1024 * 1024
 
+_chunks_adapter = TypeAdapter(List[KnowledgeChunkResponse])
+
 
 @router.post("/upload", response_model=KnowledgeUploadResponse)
 async def upload_knowledge(
@@ -149,9 +152,10 @@ async def get_document_chunks(
         select(KnowledgeChunk).where(KnowledgeChunk.document_id == doc_id)
         .order_by(KnowledgeChunk.chunk_index)
     )
-    chunks = result.scalars().all()
+    chunks = _chunks_adapter.validate_python(result.scalars().all(), from_attributes=True)
     
-    return [KnowledgeChunkResponse.model_validate(chunk) for chunk in chunks]
+    # Already validated above; serialize directly instead of FastAPI re-validating
+    return Response(content=_chunks_adapter.dump_json(chunks), media_type="application/json")
 
 
 @router.post("/{doc_id}/reprocess")
@@ -4,7 +4,6 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from slugify import slugify
-import re
 
 from app.db import get_db, Organization, Department, User
 from app.schemas import (
@@ -12,17 +11,11 @@ from app.schemas import (
     DepartmentCreate, DepartmentResponse
 )
 from app.core.security import get_current_user, require_admin
+from app.core.utils import create_slug
 
 router = APIRouter(redirect_slashes=False)
 
 
-def create_slug(name: str) -> str:
-    slug = name.lower().strip()
-    slug = re.sub(r'[^\w\s-]', '', slug)
-    slug = re.sub(r'[-\s]+', '-', slug)
-    return slug
-
-
 def get_user_id(current_user: dict) -> UUID:
     user_id = current_user.get("sub")
     if isinstance(user_id, str):
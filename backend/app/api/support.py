@@ -1,32 +1,59 @@
+import base64
+import binascii
 from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, and_, or_
+from sqlalchemy.orm import contains_eager, selectinload
+from pydantic import TypeAdapter
 
 from app.db import (
     get_db, Escalation, EscalationStatus, Conversation, 
-    ConversationStatus, Message, User
+    ConversationStatus, Message, MessageRole, User
 )
 from app.schemas import (
-    EscalationResponse, EscalationResolve, EscalationAssign,
+    EscalationResponse, EscalationPage, EscalationResolve, EscalationAssign,
     ConversationResponse, MessageResponse
 )
 from app.core.security import get_current_user, require_support
 
 router = APIRouter()
 
+_escalations_adapter = TypeAdapter(List[EscalationResponse])
 
-@router.get("/escalations", response_model=List[EscalationResponse])
+
+def _encode_cursor(*parts) -> str:
+    raw = "|".join(str(p) for p in parts)
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str, size: int) -> List[str]:
+    try:
+        parts = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+    except (binascii.Error, UnicodeDecodeError):
+        parts = []
+    if len(parts) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return parts
+
+
+@router.get("/escalations", response_model=EscalationPage)
 async def list_escalations(
     organization_id: UUID,
     status: Optional[EscalationStatus] = None,
     assigned_to_me: bool = False,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
     current_user: dict = Depends(require_support),
     db: AsyncSession = Depends(get_db)
 ):
-    query = select(Escalation).join(Conversation).where(
+    # The joined conversation populates Escalation.conversation directly;
+    # messages aren't part of the listing, so skip loading them.
+    query = select(Escalation).join(Conversation).options(
+        contains_eager(Escalation.conversation).noload(Conversation.messages)
+    ).where(
         Conversation.organization_id == organization_id
     )
     
@@ -36,58 +63,99 @@ async def list_escalations(
     if assigned_to_me:
         query = query.where(Escalation.assigned_to_id == current_user["sub"])
     
-    query = query.order_by(Escalation.priority.desc(), Escalation.created_at)
+    if cursor:
+        last_priority, last_created_at, last_id = _decode_cursor(cursor, 3)
+        try:
+            last_priority = int(last_priority)
+            last_created_at = datetime.fromisoformat(last_created_at)
+            last_id = UUID(last_id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        # Keyset continuation for ORDER BY priority DESC, created_at, id
+        query = query.where(or_(
+            Escalation.priority < last_priority,
+            and_(
+                Escalation.priority == last_priority,
+                or_(
+                    Escalation.created_at > last_created_at,
+                    and_(Escalation.created_at == last_created_at, Escalation.id > last_id),
+                ),
+            ),
+        ))
+    
+    query = query.order_by(
+        Escalation.priority.desc(), Escalation.created_at, Escalation.id
+    ).limit(limit + 1)
     
     result = await db.execute(query)
     escalations = result.scalars().all()
     
-    responses = []
-    for esc in escalations:
-        esc_response = EscalationResponse.model_validate(esc)
-        
-        conv_result = await db.execute(
-            select(Conversation).where(Conversation.id == esc.conversation_id)
-        )
-        conv = conv_result.scalar_one_or_none()
-        if conv:
-            esc_response.conversation = ConversationResponse.model_validate(conv)
-        
-        responses.append(esc_response)
+    next_cursor = None
+    if len(escalations) > limit:
+        escalations = escalations[:limit]
+        last = escalations[-1]
+        next_cursor = _encode_cursor(last.priority, last.created_at.isoformat(), last.id)
     
-    return responses
+    return EscalationPage(
+        items=_escalations_adapter.validate_python(escalations, from_attributes=True),
+        next_cursor=next_cursor,
+    )
 
 
 @router.get("/escalations/{escalation_id}", response_model=EscalationResponse)
 async def get_escalation(
     escalation_id: UUID,
+    messages_cursor: Optional[str] = None,
+    messages_limit: int = Query(100, ge=1, le=500),
     current_user: dict = Depends(require_support),
     db: AsyncSession = Depends(get_db)
 ):
+    # Messages are paged separately below, so keep the collection unloaded
     result = await db.execute(
-        select(Escalation).where(Escalation.id == escalation_id)
+        select(Escalation)
+        .options(selectinload(Escalation.conversation).noload(Conversation.messages))
+        .where(Escalation.id == escalation_id)
     )
     escalation = result.scalar_one_or_none()
     
     if not escalation:
         raise HTTPException(status_code=404, detail="Escalation not found")
     
-    conv_result = await db.execute(
-        select(Conversation).where(Conversation.id == escalation.conversation_id)
-    )
-    conversation = conv_result.scalar_one_or_none()
+    conversation = escalation.conversation
     
+    conv_response = None
+    next_messages_cursor = None
     if conversation:
+        msg_query = select(Message).where(Message.conversation_id == conversation.id)
+        
+        if messages_cursor:
+            last_created_at, last_id = _decode_cursor(messages_cursor, 2)
+            try:
+                last_created_at = datetime.fromisoformat(last_created_at)
+                last_id = UUID(last_id)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            msg_query = msg_query.where(or_(
+                Message.created_at > last_created_at,
+                and_(Message.created_at == last_created_at, Message.id > last_id),
+            ))
+        
         msg_result = await db.execute(
-            select(Message).where(Message.conversation_id == conversation.id)
-            .order_by(Message.created_at)
+            msg_query.order_by(Message.created_at, Message.id).limit(messages_limit + 1)
         )
         messages = msg_result.scalars().all()
         
+        if len(messages) > messages_limit:
+            messages = messages[:messages_limit]
+            last = messages[-1]
+            next_messages_cursor = _encode_cursor(last.created_at.isoformat(), last.id)
+        
         conv_response = ConversationResponse.model_validate(conversation)
         conv_response.messages = [MessageResponse.model_validate(msg) for msg in messages]
     
     esc_response = EscalationResponse.model_validate(escalation)
     esc_response.conversation = conv_response
+    esc_response.next_messages_cursor = next_messages_cursor
     
     return esc_response
 
@@ -99,25 +167,29 @@ async def assign_escalation(
     current_user: dict = Depends(require_support),
     db: AsyncSession = Depends(get_db)
 ):
+    # One round trip checks both; a missing escalation is reported before a bad assignee
     result = await db.execute(
-        select(Escalation).where(Escalation.id == escalation_id)
+        select(
+            select(Escalation.id).where(Escalation.id == escalation_id).scalar_subquery(),
+            select(User.role).where(User.id == assignment.assigned_to_id).scalar_subquery(),
+        )
     )
-    escalation = result.scalar_one_or_none()
+    found_id, assignee_role = result.one()
     
-    if not escalation:
+    if found_id is None:
         raise HTTPException(status_code=404, detail="Escalation not found")
     
-    user_result = await db.execute(
-        select(User).where(User.id == assignment.assigned_to_id)
-    )
-    assignee = user_result.scalar_one_or_none()
-    
-    if not assignee or assignee.role.value not in ["admin", "support"]:
+    if assignee_role is None or assignee_role.value not in ["admin", "support"]:
         raise HTTPException(status_code=400, detail="Invalid assignee")
     
-    escalation.assigned_to_id = assignment.assigned_to_id
-    escalation.status = EscalationStatus.IN_REVIEW
-    
+    await db.execute(
+        update(Escalation)
+        .where(Escalation.id == escalation_id)
+        .values(
+            assigned_to_id=assignment.assigned_to_id,
+            status=EscalationStatus.IN_REVIEW,
+        )
+    )
     await db.commit()
     
     return {"message": "Escalation assigned successfully"}
@@ -131,21 +203,24 @@ async def resolve_escalation(
     db: AsyncSession = Depends(get_db)
 ):
     result = await db.execute(
-        select(Escalation).where(Escalation.id == escalation_id)
+        update(Escalation)
+        .where(Escalation.id == escalation_id)
+        .values(
+            status=EscalationStatus.RESOLVED,
+            final_response=resolution.final_response,
+            resolution_notes=resolution.resolution_notes,
+            resolved_at=datetime.utcnow(),
+        )
+        .returning(Escalation.conversation_id)
     )
-    escalation = result.scalar_one_or_none()
+    conversation_id = result.scalar_one_or_none()
     
-    if not escalation:
+    if conversation_id is None:
         raise HTTPException(status_code=404, detail="Escalation not found")
     
-    escalation.status = EscalationStatus.RESOLVED
-    escalation.final_response = resolution.final_response
-    escalation.resolution_notes = resolution.resolution_notes
-    escalation.resolved_at = datetime.utcnow()
-    
     message = Message(
-        conversation_id=escalation.conversation_id,
-        role="assistant",
+        conversation_id=conversation_id,
+        role=MessageRole.ASSISTANT,
         content=resolution.final_response,
         agent_name="human_support",
         confidence_score=1.0,
@@ -153,12 +228,11 @@ async def resolve_escalation(
     )
     db.add(message)
     
-    conv_result = await db.execute(
-        select(Conversation).where(Conversation.id == escalation.conversation_id)
+    await db.execute(
+        update(Conversation)
+        .where(Conversation.id == conversation_id)
+        .values(status=ConversationStatus.RESOLVED)
     )
-    conversation = conv_result.scalar_one_or_none()
-    if conversation:
-        conversation.status = ConversationStatus.RESOLVED
     
     await db.commit()
     
@@ -173,17 +247,18 @@ async def dismiss_escalation(
     db: AsyncSession = Depends(get_db)
 ):
     result = await db.execute(
-        select(Escalation).where(Escalation.id == escalation_id)
+        update(Escalation)
+        .where(Escalation.id == escalation_id)
+        .values(
+            status=EscalationStatus.DISMISSED,
+            resolution_notes=reason,
+            resolved_at=datetime.utcnow(),
+        )
+        .returning(Escalation.id)
     )
-    escalation = result.scalar_one_or_none()
-    
-    if not escalation:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Escalation not found")
     
-    escalation.status = EscalationStatus.DISMISSED
-    escalation.resolution_notes = reason
-    escalation.resolved_at = datetime.utcnow()
-    
     await db.commit()
     
     return {"message": "Escalation dismissed"}
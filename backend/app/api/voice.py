@@ -1,46 +1,51 @@
 import base64
+import hashlib
+from contextlib import AsyncExitStack
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import Response, StreamingResponse
 from app.schemas import (
     VoiceTranscriptionRequest, VoiceTranscriptionResponse,
-    TextToSpeechRequest, TextToSpeechResponse
+    TextToSpeechRequest
 )
 from app.core.security import get_current_user
 from app.core.config import settings
+from app.core.cache import cache_get, cache_set
 
 router = APIRouter()
 
+_OPENAI_KEY = settings.OPENAI_API_KEY
+_CACHE_TTL = settings.VOICE_CACHE_TTL_SECONDS
+
 
 @router.post("/transcribe", response_model=VoiceTranscriptionResponse)
 async def transcribe_audio(
     request: VoiceTranscriptionRequest,
 ):
     try:
-        from openai import OpenAI
-        import tempfile
-        import os
+        from openai import AsyncOpenAI
+        
+        cache_key = "stt:" + hashlib.sha256(
+            f"{request.format}|{request.audio_data}".encode()
+        ).hexdigest()
+        cached = await cache_get(cache_key)
+        if cached:
+            return VoiceTranscriptionResponse(text=cached.decode(), confidence=0.95)
         
-        client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        client = AsyncOpenAI(api_key=_OPENAI_KEY)
         
         audio_bytes = base64.b64decode(request.audio_data)
         
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f".{request.format}") as f:
-            f.write(audio_bytes)
-            temp_path = f.name
+        transcript = await client.audio.transcriptions.create(
+            model="whisper-1",
+            file=(f"audio.{request.format}", audio_bytes, f"audio/{request.format}"),
+            response_format="verbose_json"
+        )
+        await cache_set(cache_key, transcript.text, _CACHE_TTL)
         
-        try:
-            with open(temp_path, "rb") as audio_file:
-                transcript = client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file,
-                    response_format="verbose_json"
-                )
-            
-            return VoiceTranscriptionResponse(
-                text=transcript.text,
-                confidence=0.95  
-            )
-        finally:
-            os.unlink(temp_path)
+        return VoiceTranscriptionResponse(
+            text=transcript.text,
+            confidence=0.95  
+        )
             
     except Exception as e:
         return VoiceTranscriptionResponse(
@@ -49,28 +54,50 @@ async def transcribe_audio(
         )
 
 
-@router.post("/synthesize", response_model=TextToSpeechResponse)
+@router.post("/synthesize")
 async def synthesize_speech(
     request: TextToSpeechRequest,
 ):
+    """Stream synthesized speech as raw audio/mpeg"""
     try:
-        from openai import OpenAI
+        from openai import AsyncOpenAI
+        
+        cache_key = "tts:mp3:" + hashlib.sha256(
+            f"{request.voice}|{request.text}".encode()
+        ).hexdigest()
+        cached = await cache_get(cache_key)
+        if cached:
+            return Response(content=cached, media_type="audio/mpeg")
         
-        client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        client = AsyncOpenAI(api_key=_OPENAI_KEY)
         
-        response = client.audio.speech.create(
-            model="tts-1",
-            voice=request.voice,
-            input=request.text,
-            response_format="mp3"
+        # Open the upstream response here so its errors still become a 500,
+        # before any 200 headers are sent; the generator owns it from then on
+        stack = AsyncExitStack()
+        response = await stack.enter_async_context(
+            client.audio.speech.with_streaming_response.create(
+                model="tts-1",
+                voice=request.voice,
+                input=request.text,
+                response_format="mp3"
+            )
         )
         
-        audio_data = base64.b64encode(response.content).decode('utf-8')
+        async def stream_audio():
+            chunks = []
+            completed = False
+            try:
+                async for chunk in response.iter_bytes(8192):
+                    chunks.append(chunk)
+                    yield chunk
+                completed = True
+            finally:
+                await stack.aclose()
+            # Only cache audio that was received in full
+            if completed:
+                await cache_set(cache_key, b"".join(chunks), _CACHE_TTL)
         
-        return TextToSpeechResponse(
-            audio_data=audio_data,
-            format="mp3"
-        )
+        return StreamingResponse(stream_audio(), media_type="audio/mpeg")
         
     except Exception as e:
         raise HTTPException(
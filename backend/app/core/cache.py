@@ -0,0 +1,40 @@
+from typing import Optional, Union
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger()
+
+_client = None
+
+
+def get_redis():
+    """Shared async Redis client, or None when caching is disabled"""
+    global _client
+    if settings.DEBUG or not settings.REDIS_URL:
+        return None
+    if _client is None:
+        import redis.asyncio as redis
+        _client = redis.from_url(settings.REDIS_URL)
+    return _client
+
+
+async def cache_get(key: str) -> Optional[bytes]:
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        return await client.get(key)
+    except Exception as e:
+        logger.warning("Cache read failed", key=key, error=str(e))
+        return None
+
+
+async def cache_set(key: str, value: Union[str, bytes], ttl_seconds: int) -> None:
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        await client.setex(key, ttl_seconds, value)
+    except Exception as e:
+        logger.warning("Cache write failed", key=key, error=str(e))
@@ -1,7 +1,8 @@
+import os
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 BACKEND_DIR = Path(__file__).resolve().parent.parent.parent
 
@@ -14,7 +15,11 @@ class Settings(BaseSettings):
     DEBUG: bool = True
     SECRET_KEY: str = "change-me-in-production"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24  # 24 hours
+    # Worker processes for password hashing; each argon2 hash holds ~19MB while it runs
+    PASSWORD_HASH_WORKERS: int = min(4, os.cpu_count() or 1)
     BASE_URL: str = "http://localhost:8080"
+    # The chat widget is embedded on customer sites; list them explicitly to lock this down
+    CORS_ORIGINS: List[str] = ["*"]
     
     DATABASE_URL: str = f"sqlite+aiosqlite:///{DB_PATH}"
     
@@ -30,16 +35,21 @@ class Settings(BaseSettings):
     CHROMA_HOST: Optional[str] = None  # For remote ChromaDB
     CHROMA_PORT: Optional[int] = None
     
+    REDIS_URL: Optional[str] = None  # Enables response caching when set
+    VOICE_CACHE_TTL_SECONDS: int = 60 * 60 * 24  # 24 hours
+    
     UPLOAD_DIRECTORY: str = str((BACKEND_DIR / "data" / "uploads").as_posix())
     MAX_UPLOAD_SIZE: int = 50 * 1024 * 1024  # 50MB
     
     CONFIDENCE_THRESHOLD: float = 0.7
+    HISTORY_WINDOW: int = 20  # Messages of prior context loaded per chat turn
     MAX_RETRIES: int = 3
     
     model_config = {
         "env_file": str((BACKEND_DIR / ".." / ".env").resolve()),
         "case_sensitive": True,
-        "extra": "ignore"  
+        "extra": "ignore",
+        "frozen": True,
     }
 
 
@@ -1,22 +1,31 @@
+import time
 from collections import defaultdict
-from datetime import datetime, timedelta
 from typing import Optional
 from fastapi import Request, HTTPException
 import structlog
 
 logger = structlog.get_logger()
 
+SECONDS_PER_DAY = 86400
+
+
+def _day_key() -> int:
+    """UTC day number; cheaper than formatting a date string"""
+    return int(time.time()) // SECONDS_PER_DAY
+
 
 class RateLimiter:
     
     def __init__(self):
-        # {ip: [(timestamp, endpoint), ...]}
-        self.requests: dict[str, list[tuple[datetime, str]]] = defaultdict(list)
+        # {ip: [(monotonic_ts, endpoint), ...]}
+        self.requests: dict[str, list[tuple[float, str]]] = defaultdict(list)
         # {ip: upload_count_today}
-        self.daily_uploads: dict[str, tuple[str, int]] = {}  # (date_str, count)
+        self.daily_uploads: dict[str, tuple[int, int]] = {}  # (day_key, count)
         
-    def _cleanup_old_requests(self, ip: str, window_seconds: int = 60):
-        cutoff = datetime.utcnow() - timedelta(seconds=window_seconds)
+    def _cleanup_old_requests(self, ip: str, window_seconds: int = 60, now: Optional[float] = None):
+        if now is None:
+            now = time.monotonic()
+        cutoff = now - window_seconds
         self.requests[ip] = [
             (ts, ep) for ts, ep in self.requests[ip] 
             if ts > cutoff
@@ -29,7 +38,8 @@ class RateLimiter:
         max_requests: int = 30,  # per minute
         window_seconds: int = 60
     ) -> bool:
-        self._cleanup_old_requests(ip, window_seconds)
+        now = time.monotonic()
+        self._cleanup_old_requests(ip, window_seconds, now)
         
         # Count requests in window
         count = len(self.requests[ip])
@@ -39,15 +49,15 @@ class RateLimiter:
             return False
         
         # Record this request
-        self.requests[ip].append((datetime.utcnow(), endpoint))
+        self.requests[ip].append((now, endpoint))
         return True
     
     def check_daily_upload_limit(self, ip: str, max_uploads: int = 5) -> bool:
-        today = datetime.utcnow().strftime("%Y-%m-%d")
+        today = _day_key()
         
         if ip in self.daily_uploads:
-            date_str, count = self.daily_uploads[ip]
-            if date_str == today:
+            day, count = self.daily_uploads[ip]
+            if day == today:
                 if count >= max_uploads:
                     logger.warning("Daily upload limit exceeded", ip=ip, count=count)
                     return False
@@ -61,12 +71,12 @@ class RateLimiter:
         return True
     
     def check_daily_chat_limit(self, ip: str, max_messages: int = 50) -> bool:
-        today = datetime.utcnow().strftime("%Y-%m-%d")
+        today = _day_key()
         key = f"chat_{ip}"
         
         if key in self.daily_uploads:
-            date_str, count = self.daily_uploads[key]
-            if date_str == today:
+            day, count = self.daily_uploads[key]
+            if day == today:
                 if count >= max_messages:
                     logger.warning("Daily chat limit exceeded", ip=ip, count=count)
                     return False
@@ -1,5 +1,10 @@
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
+from cachetools import TTLCache
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
@@ -7,38 +12,100 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt stays listed so legacy hashes still verify; they are deprecated and
+# upgraded to argon2id on the next successful login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__time_cost=2,
+    argon2__memory_cost=19456,
+    argon2__parallelism=1,
+)
 
 ALGORITHM = "HS256"
+_SECRET_BYTES = settings.SECRET_KEY.encode()
+_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
+_DECODE_OPTS = {
+    "verify_aud": False,
+    "verify_iss": False,
+    "require_exp": True,
+    "require_sub": True,
+}
 
 security = HTTPBearer()
 
+# Validated token payloads, keyed by the raw token string
+_token_cache = TTLCache(maxsize=10_000, ttl=60)
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
 
+_hash_pool: Optional[ProcessPoolExecutor] = None
 
-def get_password_hash(password: str) -> str:
+
+def _get_hash_pool() -> ProcessPoolExecutor:
+    # Created lazily so importing this module (alembic, scripts) doesn't spawn workers.
+    # Never fork: that would copy the running event loop's threads and locks into
+    # the workers. forkserver is unavailable on Windows, where spawn is the default.
+    global _hash_pool
+    if _hash_pool is None:
+        start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        _hash_pool = ProcessPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            mp_context=multiprocessing.get_context(start_method),
+        )
+    return _hash_pool
+
+
+def shutdown_hash_pool() -> None:
+    global _hash_pool
+    if _hash_pool is not None:
+        _hash_pool.shutdown(wait=False, cancel_futures=True)
+        _hash_pool = None
+
+
+def _verify_and_update(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+def _hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def verify_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Returns (verified, new_hash); new_hash is set when the stored hash should be replaced"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_hash_pool(), _verify_and_update, plain_password, hashed_password)
+
+
+async def get_password_hash(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_hash_pool(), _hash, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = datetime.utcnow() + timedelta(minutes=_TOKEN_EXPIRE_MINUTES)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _SECRET_BYTES, algorithm=ALGORITHM)
     return encoded_jwt
 
 
 def decode_access_token(token: str) -> Optional[dict]:
+    cached = _token_cache.get(token)
+    if cached is not None:
+        if cached.get("exp", 0) > time.time():
+            return cached
+        _token_cache.pop(token, None)
+    
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
+        payload = jwt.decode(token, _SECRET_BYTES, algorithms=[ALGORITHM], options=_DECODE_OPTS)
     except JWTError:
         return None
+    
+    _token_cache[token] = payload
+    return payload
 
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
@@ -0,0 +1,9 @@
+import re
+
+
+_NONWORD = re.compile(r'[^\w\s-]')
+_DASHES = re.compile(r'[-\s]+')
+
+
+def create_slug(name: str) -> str:
+    return _DASHES.sub('-', _NONWORD.sub('', name.lower().strip()))
@@ -6,8 +6,8 @@ from app.db.models import (
     Chatbot,
     KnowledgeDocument, KnowledgeChunk, KnowledgeType, ProcessingStatus,
     AgentPipeline, AgentRun,
-    Conversation, ConversationStatus, Message,
-    Escalation, EscalationStatus,
+    Conversation, ConversationStatus, Message, MessageRole,
+    Escalation, EscalationStatus, EscalationReason,
 )
 
 __all__ = [
@@ -30,6 +30,8 @@ __all__ = [
     "Conversation",
     "ConversationStatus",
     "Message",
+    "MessageRole",
     "Escalation",
     "EscalationStatus",
+    "EscalationReason",
 ]
@@ -1,33 +1,86 @@
 from datetime import datetime
 from sqlalchemy import (
     Column, String, Integer, Float, Boolean, Text, DateTime, 
-    ForeignKey, Enum, JSON, Table, TypeDecorator, CHAR
+    ForeignKey, Enum, JSON, Table, TypeDecorator, BINARY, Index, SmallInteger, UniqueConstraint,
+    DDL, event
 )
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import relationship
+import os
+import time
 import uuid
 import enum
 
 from app.db.session import Base
 
 
+# Binary JSONB on PostgreSQL (indexable, no reparse on read), plain JSON elsewhere
+JSONB = JSON().with_variant(postgresql.JSONB(), 'postgresql')
+
+
+def uuid7() -> uuid.UUID:
+    """Time-ordered UUIDv7 (RFC 9562) so new primary keys append to the index"""
+    ms = time.time_ns() // 1_000_000
+    value = (ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 class GUID(TypeDecorator):
-    impl = CHAR
+    """Native UUID on PostgreSQL, 16-byte BINARY elsewhere"""
+    impl = BINARY(16)
+    cache_ok = True
+    
+    def load_dialect_impl(self, dialect):
+        if dialect.name == 'postgresql':
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=True))
+        return dialect.type_descriptor(BINARY(16))
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return value
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(str(value))
+        if dialect.name == 'postgresql':
+            return value
+        return value.bytes
+    
+    def process_result_value(self, value, dialect):
+        if value is None or isinstance(value, uuid.UUID):
+            return value
+        return uuid.UUID(bytes=value)
+
+
+class SmallEnum(TypeDecorator):
+    """Native ENUM on PostgreSQL, SMALLINT member code elsewhere.
+    
+    Codes are positions in the enum's definition order, so new members must
+    only ever be appended.
+    """
+    impl = Enum
     cache_ok = True
     
+    def __init__(self, enum_class):
+        super().__init__(enum_class)
+        self.enum_class = enum_class
+        self._members = list(enum_class)
+    
     def load_dialect_impl(self, dialect):
-        return dialect.type_descriptor(CHAR(32))
+        if dialect.name == 'postgresql':
+            return dialect.type_descriptor(self.impl)
+        return dialect.type_descriptor(SmallInteger())
     
     def process_bind_param(self, value, dialect):
-        if value is not None:
-            if isinstance(value, uuid.UUID):
-                return value.hex
-            return str(value).replace('-', '')
-        return value
+        if value is None or dialect.name == 'postgresql':
+            return value
+        return self._members.index(self.enum_class(value))
     
     def process_result_value(self, value, dialect):
-        if value is not None:
-            return uuid.UUID(value)
-        return value
+        if value is None or dialect.name == 'postgresql':
+            return value
+        # Legacy VARCHAR columns on SQLite hand the code back as text
+        return self._members[int(value)]
 
 
 class UserRole(str, enum.Enum):
@@ -65,6 +118,20 @@ class ProcessingStatus(str, enum.Enum):
     FAILED = "failed"
 
 
+class MessageRole(str, enum.Enum):
+    USER = "user"
+    ASSISTANT = "assistant"
+    SYSTEM = "system"
+    TOOL = "tool"
+
+
+class EscalationReason(str, enum.Enum):
+    LOW_CONFIDENCE = "low_confidence"
+    PROCESSING_ERROR = "processing_error"
+    CUSTOMER_REQUEST = "customer_request"
+    OTHER = "other"
+
+
 chatbot_department = Table(
     'chatbot_department',
     Base.metadata,
@@ -73,14 +140,22 @@ chatbot_department = Table(
 )
 
 
+chatbot_document = Table(
+    'chatbot_document',
+    Base.metadata,
+    Column('chatbot_id', GUID(), ForeignKey('chatbots.id', ondelete='CASCADE'), primary_key=True),
+    Column('document_id', GUID(), ForeignKey('knowledge_documents.id', ondelete='CASCADE'), primary_key=True, index=True),
+)
+
+
 class User(Base):
     __tablename__ = "users"
     
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=uuid7)
     email = Column(String(255), unique=True, nullable=False, index=True)
     hashed_password = Column(String(255), nullable=False)
     full_name = Column(String(255))
-    role = Column(Enum(UserRole), default=UserRole.CUSTOMER)
+    role = Column(SmallEnum(UserRole), default=UserRole.CUSTOMER)
     organization_id = Column(GUID(), ForeignKey("organizations.id"))
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -94,32 +169,32 @@ class User(Base):
 class Organization(Base):
     __tablename__ = "organizations"
     
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=uuid7)
     name = Column(String(255), nullable=False)
     slug = Column(String(255), unique=True, nullable=False, index=True)
     description = Column(Text)
-    settings = Column(JSON, default=dict)
+    settings = Column(JSONB, default=dict)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     users = relationship("User", back_populates="organization")
-    departments = relationship("Department", back_populates="organization", cascade="all, delete-orphan")
-    chatbots = relationship("Chatbot", back_populates="organization", cascade="all, delete-orphan")
-    knowledge_documents = relationship("KnowledgeDocument", back_populates="organization", cascade="all, delete-orphan")
-    agent_pipelines = relationship("AgentPipeline", back_populates="organization", cascade="all, delete-orphan")
-    conversations = relationship("Conversation", back_populates="organization", cascade="all, delete-orphan")
+    departments = relationship("Department", back_populates="organization", cascade="all, delete-orphan", passive_deletes=True)
+    chatbots = relationship("Chatbot", back_populates="organization", cascade="all, delete-orphan", passive_deletes=True)
+    knowledge_documents = relationship("KnowledgeDocument", back_populates="organization", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
+    agent_pipelines = relationship("AgentPipeline", back_populates="organization", cascade="all, delete-orphan", passive_deletes=True)
+    conversations = relationship("Conversation", back_populates="organization", cascade="all, delete-orphan", passive_deletes=True)
 
 
 class Department(Base):
     __tablename__ = "departments"
     
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
-    organization_id = Column(GUID(), ForeignKey("organizations.id"), nullable=False)
+    id = Column(GUID(), primary_key=True, default=uuid7)
+    organization_id = Column(GUID(), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
     name = Column(String(255), nullable=False)
     slug = Column(String(255), nullable=False)
     description = Column(Text)
-    settings = Column(JSON, default=dict)
+    settings = Column(JSONB, default=dict)
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # Relationships
@@ -131,8 +206,8 @@ class Department(Base):
 class Chatbot(Base):
     __tablename__ = "chatbots"
     
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
-    organization_id = Column(GUID(), ForeignKey("organizations.id"), nullable=False)
+    id = Column(GUID(), primary_key=True, default=uuid7)
+    organization_id = Column(GUID(), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
     
     name = Column(String(255), nullable=False)
     slug = Column(String(255), nullable=False)
@@ -144,8 +219,6 @@ class Chatbot(Base):
     temperature = Column(Float, default=0.7)
     confidence_threshold = Column(Float, default=0.7)
     
-    document_ids = Column(JSON, default=list)
-    
     primary_color = Column(String(20), default="#6366f1")
     avatar_url = Column(String(500))
     
@@ -156,13 +229,18 @@ class Chatbot(Base):
     organization = relationship("Organization", back_populates="chatbots")
     departments = relationship("Department", secondary=chatbot_department, back_populates="chatbots")
     conversations = relationship("Conversation", back_populates="chatbot")
+    documents = relationship("KnowledgeDocument", secondary=chatbot_document, lazy="selectin")
+    
+    @property
+    def document_ids(self):
+        return [d.id for d in self.documents]
 
 
 class KnowledgeDocument(Base):
     __tablename__ = "knowledge_documents"
     
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
-    organization_id = Column(GUID(), ForeignKey("organizations.id"), nullable=False)
+    id = Column(GUID(), primary_key=True, default=uuid7)
+    organization_id = Column(GUID(), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
     department_id = Column(GUID(), ForeignKey("departments.id"))
     
     title = Column(String(255), nullable=False)
@@ -171,69 +249,76 @@ class KnowledgeDocument(Base):
     file_type = Column(String(50))
     file_size = Column(Integer)
     
-    knowledge_type = Column(Enum(KnowledgeType), default=KnowledgeType.GENERAL)
-    processing_status = Column(Enum(ProcessingStatus), default=ProcessingStatus.PENDING)
+    knowledge_type = Column(SmallEnum(KnowledgeType), default=KnowledgeType.GENERAL)
+    processing_status = Column(SmallEnum(ProcessingStatus), default=ProcessingStatus.PENDING)
     processing_error = Column(Text)
     
-    structured_content = Column(JSON)
-    meta_data = Column(JSON, default=dict)
+    structured_content = Column(JSONB)
+    meta_data = Column(JSONB, default=dict)
     
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     organization = relationship("Organization", back_populates="knowledge_documents")
     department = relationship("Department", back_populates="knowledge_documents")
-    chunks = relationship("KnowledgeChunk", back_populates="document", cascade="all, delete-orphan")
+    chunks = relationship("KnowledgeChunk", back_populates="document", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
 
 
 class KnowledgeChunk(Base):
     __tablename__ = "knowledge_chunks"
     
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
-    document_id = Column(GUID(), ForeignKey("knowledge_documents.id"), nullable=False)
+    id = Column(GUID(), primary_key=True, default=uuid7)
+    document_id = Column(GUID(), ForeignKey("knowledge_documents.id", ondelete="CASCADE"), nullable=False)
     
     content = Column(Text, nullable=False)
-    chunk_index = Column(Integer, default=0)
-    knowledge_type = Column(Enum(KnowledgeType))
+    chunk_index = Column(Integer, nullable=False)
+    knowledge_type = Column(SmallEnum(KnowledgeType))
     
-    vector_id = Column(String(255))
+    # Chroma document id; also used to map search hits back to chunks
+    vector_id = Column(GUID())
     
-    meta_data = Column(JSON, default=dict)
+    meta_data = Column(JSONB, default=dict)
     created_at = Column(DateTime, default=datetime.utcnow)
     
     document = relationship("KnowledgeDocument", back_populates="chunks")
+    
+    __table_args__ = (
+        # Also serves "chunks of a document in order" as an index range scan
+        UniqueConstraint("document_id", "chunk_index", name="uq_chunks_doc_idx"),
+        Index("uq_knowledge_chunks_vector_id", "vector_id", unique=True),
+    )
 
 
 class AgentPipeline(Base):
     __tablename__ = "agent_pipelines"
     
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
-    organization_id = Column(GUID(), ForeignKey("organizations.id"), nullable=False)
+    id = Column(GUID(), primary_key=True, default=uuid7)
+    organization_id = Column(GUID(), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
     
     name = Column(String(255), nullable=False)
     pipeline_type = Column(String(50), nullable=False)  
     description = Column(Text)
     
-    config = Column(JSON, default=dict)
-    agents = Column(JSON, default=list) 
+    config = Column(JSONB, default=dict)
+    agents = Column(JSONB, default=list) 
     
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     organization = relationship("Organization", back_populates="agent_pipelines")
-    runs = relationship("AgentRun", back_populates="pipeline", cascade="all, delete-orphan")
+    runs = relationship("AgentRun", back_populates="pipeline", cascade="all, delete-orphan", passive_deletes=True)
 
 
 class AgentRun(Base):
     __tablename__ = "agent_runs"
     
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
-    pipeline_id = Column(GUID(), ForeignKey("agent_pipelines.id"), nullable=False)
+    id = Column(GUID(), primary_key=True, default=uuid7)
+    pipeline_id = Column(GUID(), ForeignKey("agent_pipelines.id", ondelete="CASCADE"), nullable=False)
     
     status = Column(String(50), default="running")  
-    input_data = Column(JSON)
-    output_data = Column(JSON)
+    input_data = Column(JSONB)
+    output_data = Column(JSONB)
     
     langsmith_run_id = Column(String(255))
     langsmith_url = Column(String(500))
@@ -251,18 +336,18 @@ class AgentRun(Base):
 class Conversation(Base):
     __tablename__ = "conversations"
     
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
-    organization_id = Column(GUID(), ForeignKey("organizations.id"), nullable=False)
+    id = Column(GUID(), primary_key=True, default=uuid7)
+    organization_id = Column(GUID(), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
     chatbot_id = Column(GUID(), ForeignKey("chatbots.id"))
     customer_id = Column(GUID(), ForeignKey("users.id"))
     
-    session_id = Column(String(255), index=True)
+    session_id = Column(String(64))
     
-    status = Column(Enum(ConversationStatus), default=ConversationStatus.ACTIVE)
+    status = Column(SmallEnum(ConversationStatus), default=ConversationStatus.ACTIVE)
     department = Column(String(100))
     
     intent = Column(String(255))
-    entities = Column(JSON, default=dict)
+    entities = Column(JSONB, default=dict)
     
     summary = Column(Text)
     
@@ -273,22 +358,40 @@ class Conversation(Base):
     organization = relationship("Organization", back_populates="conversations")
     chatbot = relationship("Chatbot", back_populates="conversations")
     customer = relationship("User", back_populates="conversations")
-    messages = relationship("Message", back_populates="conversation", cascade="all, delete-orphan")
-    escalations = relationship("Escalation", back_populates="conversation", cascade="all, delete-orphan")
+    # Load with selectinload() where a conversation is rendered with its messages;
+    # an unplanned per-conversation lazy load raises instead of going N+1
+    messages = relationship(
+        "Message", back_populates="conversation", cascade="all, delete-orphan", passive_deletes=True,
+        order_by="Message.created_at", lazy="raise_on_sql",
+    )
+    escalations = relationship("Escalation", back_populates="conversation", cascade="all, delete-orphan", passive_deletes=True)
+    
+    __table_args__ = (
+        Index("idx_conversations_org", "organization_id"),
+        # Sessions are only ever looked up by equality; hash on PostgreSQL, btree elsewhere
+        Index("ix_conversations_session_hash", "session_id", postgresql_using="hash"),
+        # Active-conversation lists; closed/resolved rows drop out of the index
+        Index(
+            "ix_conversations_active",
+            "organization_id", updated_at.desc(),
+            postgresql_where=status == ConversationStatus.ACTIVE,
+            sqlite_where=status == ConversationStatus.ACTIVE,
+        ),
+    )
 
 
 class Message(Base):
     __tablename__ = "messages"
     
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
-    conversation_id = Column(GUID(), ForeignKey("conversations.id"), nullable=False)
+    id = Column(GUID(), primary_key=True, default=uuid7)
+    conversation_id = Column(GUID(), ForeignKey("conversations.id", ondelete="CASCADE"), nullable=False)
     
-    role = Column(String(50), nullable=False)  
+    role = Column(SmallEnum(MessageRole), nullable=False)
     content = Column(Text, nullable=False)
     
     agent_name = Column(String(100))
     confidence_score = Column(Float)
-    sources = Column(JSON, default=list)  
+    sources = Column(JSONB, default=list)  
     
     langsmith_run_id = Column(String(255))
     
@@ -297,19 +400,30 @@ class Message(Base):
     
     created_at = Column(DateTime, default=datetime.utcnow)
     
-    conversation = relationship("Conversation", back_populates="messages")
+    conversation = relationship("Conversation", back_populates="messages", lazy="selectin")
+    
+    __table_args__ = (
+        # Latest-N messages for a conversation without a sort step
+        Index("ix_messages_conv_created", "conversation_id", created_at.desc()),
+        Index(
+            "ix_messages_sources_gin", "sources",
+            postgresql_using="gin",
+            postgresql_ops={"sources": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
 
 class Escalation(Base):
     __tablename__ = "escalations"
     
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
-    conversation_id = Column(GUID(), ForeignKey("conversations.id"), nullable=False)
+    id = Column(GUID(), primary_key=True, default=uuid7)
+    conversation_id = Column(GUID(), ForeignKey("conversations.id", ondelete="CASCADE"), nullable=False)
     message_id = Column(GUID(), ForeignKey("messages.id"))
     assigned_to_id = Column(GUID(), ForeignKey("users.id"))
     
-    status = Column(Enum(EscalationStatus), default=EscalationStatus.PENDING)
-    reason = Column(String(255))  
+    status = Column(SmallEnum(EscalationStatus), default=EscalationStatus.PENDING)
+    reason = Column(SmallEnum(EscalationReason))
+    reason_detail = Column(Text)  # Stated reason when it falls outside EscalationReason
     
     confidence_score = Column(Float)
     priority = Column(Integer, default=1) 
@@ -320,5 +434,51 @@ class Escalation(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     resolved_at = Column(DateTime)
     
-    conversation = relationship("Conversation", back_populates="escalations")
+    conversation = relationship("Conversation", back_populates="escalations", lazy="selectin")
     assigned_to = relationship("User", back_populates="assigned_escalations", foreign_keys=[assigned_to_id])
+    
+    __table_args__ = (
+        # Support queue listing: filter by status, order by priority DESC, created_at
+        Index(
+            "idx_escalations_status_priority_created",
+            "status", priority.desc(), "created_at",
+            postgresql_include=["conversation_id", "assigned_to_id"],
+        ),
+        # Pending-by-priority counts for queue stats
+        Index(
+            "idx_escalations_pending_priority",
+            "priority",
+            postgresql_where=status == EscalationStatus.PENDING,
+            sqlite_where=status == EscalationStatus.PENDING,
+        ),
+        # At most one pending escalation per conversation; inserts skip conflicting rows
+        Index(
+            "uq_escalations_pending_conversation",
+            "conversation_id",
+            unique=True,
+            postgresql_where=status == EscalationStatus.PENDING,
+            sqlite_where=status == EscalationStatus.PENDING,
+        ),
+        # Open support queue; resolved/dismissed rows drop out of the index
+        Index(
+            "ix_escalations_open",
+            "assigned_to_id", "priority", "created_at",
+            postgresql_where=status.in_([EscalationStatus.PENDING, EscalationStatus.IN_REVIEW]),
+            sqlite_where=status.in_([EscalationStatus.PENDING, EscalationStatus.IN_REVIEW]),
+        ),
+    )
+
+
+def _add_pg_id_server_defaults() -> None:
+    # The ORM keeps generating time-ordered uuid7 keys client-side; on PostgreSQL the
+    # column also gets a server default so raw SQL and COPY loads can omit the id.
+    for table in Base.metadata.tables.values():
+        if "id" in table.c and isinstance(table.c.id.type, GUID):
+            event.listen(
+                table, "after_create",
+                DDL(f"ALTER TABLE {table.name} ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+                .execute_if(dialect="postgresql"),
+            )
+
+
+_add_pg_id_server_defaults()
@@ -1,3 +1,5 @@
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.pool import NullPool, StaticPool
@@ -17,6 +19,13 @@ if "sqlite" in settings.DATABASE_URL:
         },
         poolclass=StaticPool,  # Use StaticPool for SQLite
     )
+    
+    # SQLite leaves FK enforcement (and ON DELETE CASCADE) off unless asked per connection
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
 else:
     # PostgreSQL configuration
     engine = create_async_engine(
@@ -24,10 +33,12 @@ else:
         echo=settings.DEBUG,
         future=True,
         connect_args={"timeout": 30},
-        pool_size=5,
+        pool_size=50,
         max_overflow=10,
         pool_pre_ping=True,
-        pool_recycle=3600,
+        pool_recycle=1800,
+        # Bound each batched INSERT ... RETURNING from executemany()
+        insertmanyvalues_page_size=1000,
     )
 
 async_session_maker = async_sessionmaker(
@@ -52,6 +63,13 @@ async def init_db():
         logger.warning("Database creation attempt completed with note", error=str(e))
 
 
+def dialect_insert(session: AsyncSession):
+    """insert() construct for the session's backend, with ON CONFLICT support"""
+    if session.bind.dialect.name == "postgresql":
+        return postgresql.insert
+    return sqlite.insert
+
+
 async def get_db() -> AsyncSession:
     async with async_session_maker() as session:
         try:
@@ -1,15 +1,17 @@
+import importlib
 import os
 from pathlib import Path
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 import structlog
 
 from app.core.config import settings
 from app.api import auth, organizations, knowledge, chat, support, agents, voice, chatbots, demo
 from app.db.session import init_db
+from app.core.security import shutdown_hash_pool
 
 
 if settings.LANGCHAIN_TRACING_V2 and settings.LANGCHAIN_API_KEY:
@@ -35,6 +37,13 @@ logger = structlog.get_logger()
 
 DB_STATUS = {"initialized": False, "error": None}
 
+PREWARM_MODULES = (
+    "app.mcp.tools",
+    "app.agents.support_pipeline",
+    "app.agents.knowledge_pipeline",
+    "app.agents.vector_store",
+)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting CustoPilot API", version="1.0.0")
@@ -46,8 +55,13 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         DB_STATUS["error"] = str(e)
         logger.error("Database initialization failed - app will start but DB features won't work", error=str(e))
+    
+    # Modules the request path only imports lazily; load them before the first request
+    for module in PREWARM_MODULES:
+        importlib.import_module(module)
     yield
     logger.info("Shutting down CustoPilot API")
+    shutdown_hash_pool()
 
 
 app = FastAPI(
@@ -59,10 +73,12 @@ app = FastAPI(
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=settings.CORS_ORIGINS,
+    # Browsers reject credentialed responses for a wildcard origin
+    allow_credentials="*" not in settings.CORS_ORIGINS,
+    allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
+    allow_headers=["authorization", "content-type"],
+    max_age=86400,
 )
 
 WIDGET_STATIC_DIR = Path(__file__).parent.parent / "static"
@@ -107,15 +123,29 @@ async def serve_widget_test():
     return {"error": "Test page not found"}
 
 
+class ImmutableStaticFiles(StaticFiles):
+    """StaticFiles for content-hashed build output, cached by browsers for a year"""
+    
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["cache-control"] = "public, max-age=31536000, immutable"
+        return response
+
+
 STATIC_DIR = Path(__file__).parent.parent / "static"
 ASSETS_DIR = STATIC_DIR / "assets"
 if STATIC_DIR.exists() and ASSETS_DIR.exists():
-    app.mount("/assets", StaticFiles(directory=ASSETS_DIR), name="assets")
+    app.mount("/assets", ImmutableStaticFiles(directory=ASSETS_DIR), name="assets")
+    
+    INDEX_BYTES = (STATIC_DIR / "index.html").read_bytes()
+    # The build output is fixed at boot, so resolve paths by lookup instead of stat()
+    STATIC_FILES = frozenset(
+        p.relative_to(STATIC_DIR).as_posix() for p in STATIC_DIR.rglob("*") if p.is_file()
+    )
     
     @app.get("/{full_path:path}")
     async def serve_spa(full_path: str):
         """Serve the SPA for all non-API routes"""
-        file_path = STATIC_DIR / full_path
-        if file_path.exists() and file_path.is_file():
-            return FileResponse(file_path)
-        return FileResponse(STATIC_DIR / "index.html")
+        if full_path in STATIC_FILES:
+            return FileResponse(STATIC_DIR / full_path)
+        return Response(content=INDEX_BYTES, media_type="text/html")
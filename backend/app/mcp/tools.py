@@ -1,11 +1,105 @@
 from typing import Any, Dict, List, Optional
 import structlog
+from sqlalchemy import and_, select
 
 from app.core.config import settings
+from app.db.session import async_session_maker, dialect_insert
+from app.db.models import Conversation, Department, Escalation, EscalationReason, EscalationStatus, Message
+from app.services.knowledge_service import KnowledgeService
 
 logger = structlog.get_logger()
 
 
+# Static tool schemas, built once at import
+_TOOL_DEFINITIONS: List[Dict[str, Any]] = [
+    {
+        "name": "get_knowledge",
+        "description": "Search the knowledge base for relevant information",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "organization_id": {
+                    "type": "string",
+                    "description": "Organization ID"
+                },
+                "query": {
+                    "type": "string",
+                    "description": "Search query"
+                },
+                "department": {
+                    "type": "string",
+                    "description": "Filter by department"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Max results to return"
+                }
+            },
+            "required": ["organization_id", "query"]
+        }
+    },
+    {
+        "name": "get_conversation_context",
+        "description": "Get conversation history and context",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "conversation_id": {
+                    "type": "string",
+                    "description": "Conversation ID"
+                },
+                "max_messages": {
+                    "type": "integer",
+                    "description": "Max messages to retrieve"
+                }
+            },
+            "required": ["conversation_id"]
+        }
+    },
+    {
+        "name": "get_department_info",
+        "description": "Get department information and settings",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "organization_id": {
+                    "type": "string",
+                    "description": "Organization ID"
+                },
+                "department_slug": {
+                    "type": "string",
+                    "description": "Department slug"
+                }
+            },
+            "required": ["organization_id", "department_slug"]
+        }
+    },
+    {
+        "name": "escalate_to_human",
+        "description": "Escalate conversation to human support",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "conversation_id": {
+                    "type": "string",
+                    "description": "Conversation ID"
+                },
+                "reason": {
+                    "type": "string",
+                    "enum": [reason.value for reason in EscalationReason],
+                    "description": "Reason for escalation"
+                },
+                "priority": {
+                    "type": "integer",
+                    "description": "Priority level (1-3)"
+                }
+            },
+            "required": ["conversation_id", "reason"]
+        }
+    }
+]
+
+
 class MCPTools:
     
     @staticmethod
@@ -15,8 +109,6 @@ class MCPTools:
         department: Optional[str] = None,
         limit: int = 5
     ) -> Dict[str, Any]:
-        from app.services.knowledge_service import KnowledgeService
-        
         results = await KnowledgeService.search(
             organization_id=organization_id,
             query=query,
@@ -35,27 +127,33 @@ class MCPTools:
         conversation_id: str,
         max_messages: int = 10
     ) -> Dict[str, Any]:
-        from app.db.session import async_session_maker
-        from app.db.models import Conversation, Message
-        from sqlalchemy import select
-        
         async with async_session_maker() as db:
-            # Get conversation
+            # Conversation plus its last N messages in a single round trip
+            recent = (
+                select(Message.id)
+                .where(Message.conversation_id == conversation_id)
+                .order_by(Message.created_at.desc())
+                .limit(max_messages)
+            )
+            # Plain column rows; nothing here needs ORM identity or change tracking
             result = await db.execute(
-                select(Conversation).where(Conversation.id == conversation_id)
+                select(
+                    Conversation.id, Conversation.status, Conversation.department,
+                    Conversation.intent, Message.role, Message.content,
+                )
+                .outerjoin(Message, and_(
+                    Message.conversation_id == Conversation.id,
+                    Message.id.in_(recent),
+                ))
+                .where(Conversation.id == conversation_id)
+                .order_by(Message.created_at)
             )
-            conversation = result.scalar_one_or_none()
+            rows = result.all()
             
-            if not conversation:
+            if not rows:
                 return {"tool": "get_conversation_context", "error": "Conversation not found"}
             
-            msg_result = await db.execute(
-                select(Message)
-                .where(Message.conversation_id == conversation_id)
-                .order_by(Message.created_at.desc())
-                .limit(max_messages)
-            )
-            messages = msg_result.scalars().all()
+            conversation = rows[0]
             
             return {
                 "tool": "get_conversation_context",
@@ -66,8 +164,9 @@ class MCPTools:
                     "intent": conversation.intent,
                 },
                 "messages": [
-                    {"role": msg.role, "content": msg.content}
-                    for msg in reversed(messages)
+                    {"role": row.role.value, "content": row.content}
+                    for row in rows
+                    if row.role is not None
                 ]
             }
     
@@ -76,10 +175,6 @@ class MCPTools:
         organization_id: str,
         department_slug: str
     ) -> Dict[str, Any]:
-        from app.db.session import async_session_maker
-        from app.db.models import Department
-        from sqlalchemy import select
-        
         async with async_session_maker() as db:
             result = await db.execute(
                 select(Department).where(
@@ -108,111 +203,58 @@ class MCPTools:
         reason: str,
         priority: int = 1
     ) -> Dict[str, Any]:
-        from app.db.session import async_session_maker
-        from app.db.models import Escalation, EscalationStatus
+        reason_detail = None
+        try:
+            reason = EscalationReason(reason)
+        except ValueError:
+            # Still escalate when the model invents a reason outside the enum,
+            # keeping what it actually said for the support agent
+            reason, reason_detail = EscalationReason.OTHER, reason
         
-        async with async_session_maker() as db:
-            escalation = Escalation(
-                conversation_id=conversation_id,
-                status=EscalationStatus.PENDING,
-                reason=reason,
-                priority=priority,
-            )
-            db.add(escalation)
-            await db.commit()
-            await db.refresh(escalation)
-            
+        escalation_ids = await MCPTools.escalate_many([{
+            "conversation_id": conversation_id,
+            "reason": reason,
+            "reason_detail": reason_detail,
+            "priority": priority,
+        }])
+        
+        if not escalation_ids:
             return {
                 "tool": "escalate_to_human",
-                "escalation_id": str(escalation.id),
-                "status": "created"
+                "escalation_id": None,
+                "status": "already_pending"
             }
+        
+        return {
+            "tool": "escalate_to_human",
+            "escalation_id": escalation_ids[0],
+            "status": "created"
+        }
+    
+    @staticmethod
+    async def escalate_many(rows: List[Dict[str, Any]]) -> List[str]:
+        """Create escalations in one executemany INSERT ... RETURNING.
+        
+        Conversations that already have a pending escalation are skipped, so
+        the returned ids cover only the rows actually created.
+        """
+        if not rows:
+            return []
+        
+        rows = [{"status": EscalationStatus.PENDING, **row} for row in rows]
+        
+        async with async_session_maker() as db:
+            insert = dialect_insert(db)
+            result = await db.execute(
+                insert(Escalation)
+                .on_conflict_do_nothing()
+                .returning(Escalation.id),
+                rows,
+            )
+            escalation_ids = [str(row[0]) for row in result]
+            await db.commit()
+            return escalation_ids
     
     @staticmethod
     def get_tool_definitions() -> List[Dict[str, Any]]:
-        return [
-            {
-                "name": "get_knowledge",
-                "description": "Search the knowledge base for relevant information",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "organization_id": {
-                            "type": "string",
-                            "description": "Organization ID"
-                        },
-                        "query": {
-                            "type": "string",
-                            "description": "Search query"
-                        },
-                        "department": {
-                            "type": "string",
-                            "description": "Filter by department"
-                        },
-                        "limit": {
-                            "type": "integer",
-                            "description": "Max results to return"
-                        }
-                    },
-                    "required": ["organization_id", "query"]
-                }
-            },
-            {
-                "name": "get_conversation_context",
-                "description": "Get conversation history and context",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "conversation_id": {
-                            "type": "string",
-                            "description": "Conversation ID"
-                        },
-                        "max_messages": {
-                            "type": "integer",
-                            "description": "Max messages to retrieve"
-                        }
-                    },
-                    "required": ["conversation_id"]
-                }
-            },
-            {
-                "name": "get_department_info",
-                "description": "Get department information and settings",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "organization_id": {
-                            "type": "string",
-                            "description": "Organization ID"
-                        },
-                        "department_slug": {
-                            "type": "string",
-                            "description": "Department slug"
-                        }
-                    },
-                    "required": ["organization_id", "department_slug"]
-                }
-            },
-            {
-                "name": "escalate_to_human",
-                "description": "Escalate conversation to human support",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "conversation_id": {
-                            "type": "string",
-                            "description": "Conversation ID"
-                        },
-                        "reason": {
-                            "type": "string",
-                            "description": "Reason for escalation"
-                        },
-                        "priority": {
-                            "type": "integer",
-                            "description": "Priority level (1-3)"
-                        }
-                    },
-                    "required": ["conversation_id", "reason"]
-                }
-            }
-        ]
+        return _TOOL_DEFINITIONS
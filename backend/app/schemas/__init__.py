@@ -1,6 +1,6 @@
 from datetime import datetime
-from typing import Optional, List, Any
-from pydantic import BaseModel, EmailStr, Field
+from typing import Optional, List, Any, Literal
+from pydantic import AliasChoices, BaseModel, ConfigDict, EmailStr, Field
 from uuid import UUID
 from enum import Enum
 
@@ -40,6 +40,37 @@ class ProcessingStatus(str, Enum):
     FAILED = "failed"
 
 
+class MessageRole(str, Enum):
+    USER = "user"
+    ASSISTANT = "assistant"
+    SYSTEM = "system"
+    TOOL = "tool"
+
+
+class EscalationReason(str, Enum):
+    LOW_CONFIDENCE = "low_confidence"
+    PROCESSING_ERROR = "processing_error"
+    CUSTOMER_REQUEST = "customer_request"
+    OTHER = "other"
+
+
+# Field types for the API models. The enums above stay the canonical value sets;
+# Literal validates with a set lookup in pydantic-core and also accepts the ORM's
+# enum members, which come out as plain strings.
+UserRoleLiteral = Literal["admin", "support", "customer"]
+KnowledgeTypeLiteral = Literal["faq", "policy", "troubleshooting", "sales", "general"]
+ConversationStatusLiteral = Literal["active", "escalated", "resolved", "closed"]
+EscalationStatusLiteral = Literal["pending", "in_review", "resolved", "dismissed"]
+ProcessingStatusLiteral = Literal["pending", "processing", "completed", "failed"]
+MessageRoleLiteral = Literal["user", "assistant", "system", "tool"]
+EscalationReasonLiteral = Literal["low_confidence", "processing_error", "customer_request", "other"]
+
+
+class ORMModel(BaseModel):
+    """Base for response models validated straight from ORM rows"""
+    model_config = ConfigDict(from_attributes=True)
+
+
 
 class UserCreate(BaseModel):
     email: EmailStr
@@ -53,27 +84,21 @@ class UserLogin(BaseModel):
     password: str
 
 
-class OrganizationBrief(BaseModel):
+class OrganizationBrief(ORMModel):
     id: UUID
     name: str
     slug: str
-    
-    class Config:
-        from_attributes = True
 
 
-class UserResponse(BaseModel):
+class UserResponse(ORMModel):
     id: UUID
     email: str
     full_name: Optional[str]
-    role: UserRole
+    role: UserRoleLiteral
     organization_id: Optional[UUID]
     organization: Optional[OrganizationBrief] = None
     is_active: bool
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class TokenResponse(BaseModel):
@@ -95,7 +120,7 @@ class OrganizationUpdate(BaseModel):
     settings: Optional[dict] = None
 
 
-class OrganizationResponse(BaseModel):
+class OrganizationResponse(ORMModel):
     id: UUID
     name: str
     slug: str
@@ -103,9 +128,6 @@ class OrganizationResponse(BaseModel):
     settings: dict
     is_active: bool
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 
@@ -115,7 +137,7 @@ class DepartmentCreate(BaseModel):
     settings: Optional[dict] = None
 
 
-class DepartmentResponse(BaseModel):
+class DepartmentResponse(ORMModel):
     id: UUID
     organization_id: UUID
     name: str
@@ -123,25 +145,19 @@ class DepartmentResponse(BaseModel):
     description: Optional[str]
     settings: dict
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 
-class KnowledgeUploadResponse(BaseModel):
+class KnowledgeUploadResponse(ORMModel):
     id: UUID
     title: str
     original_filename: str
     file_type: str
-    processing_status: ProcessingStatus
+    processing_status: ProcessingStatusLiteral
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
-class KnowledgeDocumentResponse(BaseModel):
+class KnowledgeDocumentResponse(ORMModel):
     id: UUID
     organization_id: UUID
     department_id: Optional[UUID]
@@ -149,28 +165,22 @@ class KnowledgeDocumentResponse(BaseModel):
     original_filename: Optional[str]
     file_type: Optional[str]
     file_size: Optional[int]
-    knowledge_type: Optional[KnowledgeType]
-    processing_status: ProcessingStatus
+    knowledge_type: Optional[KnowledgeTypeLiteral]
+    processing_status: ProcessingStatusLiteral
     processing_error: Optional[str]
     structured_content: Optional[dict]
     meta_data: Optional[dict] = None
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
-class KnowledgeChunkResponse(BaseModel):
+class KnowledgeChunkResponse(ORMModel):
     id: UUID
     document_id: UUID
     content: str
     chunk_index: int
-    knowledge_type: Optional[KnowledgeType]
+    knowledge_type: Optional[KnowledgeTypeLiteral]
     meta_data: Optional[dict] = None
-    
-    class Config:
-        from_attributes = True
 
 
 
@@ -190,7 +200,7 @@ class AgentPipelineCreate(BaseModel):
     agents: Optional[List[AgentConfig]] = None
 
 
-class AgentPipelineResponse(BaseModel):
+class AgentPipelineResponse(ORMModel):
     id: UUID
     organization_id: UUID
     name: str
@@ -201,12 +211,9 @@ class AgentPipelineResponse(BaseModel):
     is_active: bool
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
-class AgentRunResponse(BaseModel):
+class AgentRunResponse(ORMModel):
     id: UUID
     pipeline_id: UUID
     status: str
@@ -219,15 +226,22 @@ class AgentRunResponse(BaseModel):
     duration_ms: Optional[int]
     started_at: datetime
     completed_at: Optional[datetime]
-    
-    class Config:
-        from_attributes = True
 
 
 
 class ChatMessage(BaseModel):
     content: str = Field(min_length=1)
-    session_id: Optional[str] = None
+    session_id: Optional[str] = Field(default=None, max_length=64)
+
+
+class SourceRef(BaseModel):
+    """Where part of an answer came from; `kind` tags the reference type"""
+    kind: Literal["chunk", "url", "faq"] = "chunk"
+    document_id: Optional[UUID] = None
+    chunk_id: Optional[UUID] = None
+    title: Optional[str] = None
+    # Messages stored before SourceRef kept this under "relevance"
+    score: Optional[float] = Field(default=None, validation_alias=AliasChoices("score", "relevance"))
 
 
 class ChatResponse(BaseModel):
@@ -235,30 +249,27 @@ class ChatResponse(BaseModel):
     message_id: UUID
     content: str
     confidence_score: Optional[float]
-    sources: List[dict] = []
+    sources: List[SourceRef] = []
     escalated: bool = False
     langsmith_url: Optional[str] = None
 
 
-class MessageResponse(BaseModel):
+class MessageResponse(ORMModel):
     id: UUID
     conversation_id: UUID
-    role: str
+    role: MessageRoleLiteral
     content: str
     agent_name: Optional[str]
     confidence_score: Optional[float]
-    sources: list
+    sources: List[SourceRef]
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
-class ConversationResponse(BaseModel):
+class ConversationResponse(ORMModel):
     id: UUID
     organization_id: UUID
     session_id: Optional[str]
-    status: ConversationStatus
+    status: ConversationStatusLiteral
     department: Optional[str]
     intent: Optional[str]
     entities: dict
@@ -266,19 +277,17 @@ class ConversationResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     messages: List[MessageResponse] = []
-    
-    class Config:
-        from_attributes = True
 
 
 
-class EscalationResponse(BaseModel):
+class EscalationResponse(ORMModel):
     id: UUID
     conversation_id: UUID
     message_id: Optional[UUID]
     assigned_to_id: Optional[UUID]
-    status: EscalationStatus
-    reason: Optional[str]
+    status: EscalationStatusLiteral
+    reason: Optional[EscalationReasonLiteral]
+    reason_detail: Optional[str] = None
     confidence_score: Optional[float]
     priority: int
     resolution_notes: Optional[str]
@@ -286,9 +295,12 @@ class EscalationResponse(BaseModel):
     created_at: datetime
     resolved_at: Optional[datetime]
     conversation: Optional[ConversationResponse] = None
-    
-    class Config:
-        from_attributes = True
+    next_messages_cursor: Optional[str] = None
+
+
+class EscalationPage(BaseModel):
+    items: List[EscalationResponse]
+    next_cursor: Optional[str] = None
 
 
 class EscalationResolve(BaseModel):
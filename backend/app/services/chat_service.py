@@ -2,16 +2,18 @@
 Chat Service for Customer Support Agent Pipeline
 """
 import uuid
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 import structlog
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update
 
+from app.db.session import dialect_insert
 from app.db.models import (
-    Conversation, Message, Escalation, EscalationStatus,
-    ConversationStatus
+    Conversation, Message, MessageRole, Escalation, EscalationStatus,
+    EscalationReason, ConversationStatus
 )
 from app.schemas import ChatResponse
 from app.core.config import settings
@@ -19,6 +21,12 @@ from app.core.config import settings
 logger = structlog.get_logger()
 
 
+@lru_cache(maxsize=1)
+def _langsmith_url_template(project: str) -> str:
+    # Keyed on the project so a different settings object still gets its own URL
+    return f"https://smith.langchain.com/o/{project}/runs/{{run_id}}"
+
+
 class ChatService:
     """Service for handling chat interactions with agent pipeline"""
     
@@ -61,14 +69,15 @@ class ChatService:
             
             # Get document_ids from chatbot
             document_ids = None
-            if chatbot and chatbot.document_ids:
-                document_ids = chatbot.document_ids
+            if chatbot and chatbot.documents:
+                document_ids = [str(d.id) for d in chatbot.documents]
             
             # Run support pipeline
             pipeline = SupportAgentPipeline()
             result = await pipeline.run(
                 user_message=user_message,
                 conversation_history=history,
+                conversation_id=str(conversation.id),
                 organization_id=organization_id,
                 department=conversation.department,
                 department_ids=department_ids,
@@ -80,54 +89,42 @@ class ChatService:
                 } if chatbot else None,
             )
             
+            # Conversation changes go out as one UPDATE with the rest of this turn's writes
+            conversation_updates = {}
+            
             # Update conversation with detected intent
             if result.get("intent"):
-                conversation.intent = result["intent"]
-                conversation.entities = result.get("entities", {})
+                conversation_updates["intent"] = result["intent"]
+                conversation_updates["entities"] = result.get("entities", {})
             
             if result.get("department"):
-                conversation.department = result["department"]
+                conversation_updates["department"] = result["department"]
             
             # Check if escalation needed
             confidence_score = result.get("confidence_score", 1.0)
-            escalated = False
+            escalation_reason = None
             
             if confidence_score < settings.CONFIDENCE_THRESHOLD:
-                escalated = await self._create_escalation(
-                    conversation=conversation,
-                    reason="low_confidence",
-                    confidence_score=confidence_score,
-                )
-                conversation.status = ConversationStatus.ESCALATED
+                escalation_reason = EscalationReason.LOW_CONFIDENCE
+                conversation_updates["status"] = ConversationStatus.ESCALATED
+            
+            sources = result.get("sources", [])
             
-            # Save assistant message
             assistant_message = Message(
                 conversation_id=conversation.id,
-                role="assistant",
+                role=MessageRole.ASSISTANT,
                 content=result["response"],
                 agent_name=result.get("agent_name", "support_pipeline"),
                 confidence_score=confidence_score,
-                sources=result.get("sources", []),
+                sources=[source.model_dump(mode="json", exclude_none=True) for source in sources],
                 langsmith_run_id=result.get("langsmith_run_id"),
             )
-            self.db.add(assistant_message)
-            await self.db.commit()
-            await self.db.refresh(assistant_message)
             
             # Build LangSmith URL if available
             langsmith_url = None
-            if result.get("langsmith_run_id") and settings.LANGCHAIN_PROJECT:
-                langsmith_url = f"https://smith.langchain.com/o/{settings.LANGCHAIN_PROJECT}/runs/{result['langsmith_run_id']}"
-            
-            return ChatResponse(
-                conversation_id=conversation.id,
-                message_id=assistant_message.id,
-                content=result["response"],
-                confidence_score=confidence_score,
-                sources=result.get("sources", []),
-                escalated=escalated,
-                langsmith_url=langsmith_url,
-            )
+            run_id = result.get("langsmith_run_id")
+            if run_id and settings.LANGCHAIN_PROJECT:
+                langsmith_url = _langsmith_url_template(settings.LANGCHAIN_PROJECT).format(run_id=run_id)
             
         except Exception as e:
             logger.error(
@@ -136,66 +133,72 @@ class ChatService:
                 error=str(e)
             )
             
-            # Return error response
-            error_message = Message(
+            # Fall back to an apology and hand the conversation to a human
+            confidence_score = 0.0
+            escalation_reason = EscalationReason.PROCESSING_ERROR
+            conversation_updates = {"status": ConversationStatus.ESCALATED}
+            sources = []
+            langsmith_url = None
+            assistant_message = Message(
                 conversation_id=conversation.id,
-                role="assistant",
+                role=MessageRole.ASSISTANT,
                 content="I apologize, but I'm having trouble processing your request. A support team member will assist you shortly.",
                 confidence_score=0.0,
             )
-            self.db.add(error_message)
-            
-            # Create escalation
-            await self._create_escalation(
+        
+        # Single write path for both outcomes: escalation, reply, conversation, one commit
+        escalated = False
+        if escalation_reason:
+            escalated = await self._create_escalation(
                 conversation=conversation,
-                reason="processing_error",
-                confidence_score=0.0,
-            )
-            conversation.status = ConversationStatus.ESCALATED
-            
-            await self.db.commit()
-            await self.db.refresh(error_message)
-            
-            return ChatResponse(
-                conversation_id=conversation.id,
-                message_id=error_message.id,
-                content=error_message.content,
-                confidence_score=0.0,
-                sources=[],
-                escalated=True,
+                reason=escalation_reason,
+                confidence_score=confidence_score,
             )
+        
+        self.db.add(assistant_message)
+        
+        if conversation_updates:
+            await self._update_conversation(conversation, conversation_updates)
+        
+        await self.db.commit()
+        
+        return ChatResponse(
+            conversation_id=conversation.id,
+            message_id=assistant_message.id,
+            content=assistant_message.content,
+            confidence_score=confidence_score,
+            sources=sources,
+            escalated=escalated,
+            langsmith_url=langsmith_url,
+        )
     
-    async def _get_conversation_history(self, conversation_id: uuid.UUID) -> list:
-        """Get conversation history for context"""
+    async def _update_conversation(self, conversation: Conversation, values: Dict[str, Any]) -> None:
+        """Apply conversation field changes as a single UPDATE; the loaded object is synced in place"""
+        await self.db.execute(
+            update(Conversation).where(Conversation.id == conversation.id).values(**values)
+        )
+    
+    async def _get_conversation_history(self, conversation_id: uuid.UUID) -> List[Tuple[str, str]]:
+        """Get the most recent (role, content) pairs, oldest first, for context"""
+        # Newest-first walk of ix_messages_conv_created, reading only the two
+        # columns the pipeline needs
         result = await self.db.execute(
-            select(Message)
+            select(Message.role, Message.content)
             .where(Message.conversation_id == conversation_id)
-            .order_by(Message.created_at)
+            .order_by(Message.created_at.desc())
+            .limit(settings.HISTORY_WINDOW)
         )
-        messages = result.scalars().all()
+        rows = result.all()
         
-        return [
-            {"role": msg.role, "content": msg.content}
-            for msg in messages
-        ]
+        return [(role.value, content) for role, content in reversed(rows)]
     
     async def _create_escalation(
         self,
         conversation: Conversation,
-        reason: str,
+        reason: EscalationReason,
         confidence_score: float
     ) -> bool:
-        """Create an escalation request"""
-        # Check if escalation already exists
-        result = await self.db.execute(
-            select(Escalation).where(
-                Escalation.conversation_id == conversation.id,
-                Escalation.status == EscalationStatus.PENDING
-            )
-        )
-        if result.scalar_one_or_none():
-            return True  # Already escalated
-        
+        """Create an escalation request unless one is already pending"""
         # Determine priority based on confidence
         if confidence_score < 0.3:
             priority = 3  # High
@@ -204,20 +207,28 @@ class ChatService:
         else:
             priority = 1  # Low
         
-        escalation = Escalation(
-            conversation_id=conversation.id,
-            status=EscalationStatus.PENDING,
-            reason=reason,
-            confidence_score=confidence_score,
-            priority=priority,
+        # The partial unique index on pending escalations makes this a no-op
+        # for conversations that are already waiting on a human
+        insert = dialect_insert(self.db)
+        result = await self.db.execute(
+            insert(Escalation)
+            .values(
+                conversation_id=conversation.id,
+                status=EscalationStatus.PENDING,
+                reason=reason,
+                confidence_score=confidence_score,
+                priority=priority,
+            )
+            .on_conflict_do_nothing()
+            .returning(Escalation.id)
         )
-        self.db.add(escalation)
         
-        logger.info(
-            "Created escalation",
-            conversation_id=str(conversation.id),
-            reason=reason,
-            priority=priority
-        )
+        if result.scalar_one_or_none() is not None:
+            logger.info(
+                "Created escalation",
+                conversation_id=str(conversation.id),
+                reason=reason,
+                priority=priority
+            )
         
         return True
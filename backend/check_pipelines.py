@@ -2,10 +2,17 @@ import asyncio
 from app.db.session import async_session_maker
 from app.db.models import AgentPipeline
 from sqlalchemy import select
+from sqlalchemy.orm import load_only, raiseload
 
 async def check():
     async with async_session_maker() as db:
-        result = await db.execute(select(AgentPipeline))
+        # Only the printed columns; any relationship access raises instead of lazy loading
+        result = await db.execute(
+            select(AgentPipeline).options(
+                load_only(AgentPipeline.name, AgentPipeline.pipeline_type),
+                raiseload("*"),
+            )
+        )
         pipelines = result.scalars().all()
         print(f"Found {len(pipelines)} pipelines:")
         for p in pipelines:
@@ -1,19 +1,12 @@
 import asyncio
 import sys
-import re
 sys.path.insert(0, '.')
 
 from sqlalchemy import select
 from app.db.session import async_session_maker, init_db
 from app.db.models import User, UserRole, Organization
 from app.core.security import get_password_hash
-
-
-def create_slug(name: str) -> str:
-    slug = name.lower().strip()
-    slug = re.sub(r'[^\w\s-]', '', slug)
-    slug = re.sub(r'[-\s]+', '-', slug)
-    return slug
+from app.core.utils import create_slug
 
 
 async def seed_admin(
@@ -43,7 +36,7 @@ async def seed_admin(
         
         admin = User(
             email=email,
-            hashed_password=get_password_hash(password),
+            hashed_password=await get_password_hash(password),
             full_name=full_name,
             role=UserRole.ADMIN,
             organization_id=org.id,
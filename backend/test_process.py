@@ -6,16 +6,21 @@ from dotenv import load_dotenv
 load_dotenv()
 
 async def test():
+    from sqlalchemy import select
+    from app.db.session import async_session_maker
+    from app.db.models import KnowledgeDocument, ProcessingStatus
     from app.services.knowledge_service import KnowledgeService
-    import sqlite3
     
-    conn = sqlite3.connect('data/custopilot.db')
-    cur = conn.cursor()
-    cur.execute("SELECT id FROM knowledge_documents WHERE processing_status = 'PENDING' LIMIT 1")
-    row = cur.fetchone()
+    async with async_session_maker() as db:
+        result = await db.execute(
+            select(KnowledgeDocument.id)
+            .where(KnowledgeDocument.processing_status == ProcessingStatus.PENDING)
+            .limit(1)
+        )
+        pending_id = result.scalar_one_or_none()
     
-    if row:
-        doc_id = row[0]
+    if pending_id:
+        doc_id = str(pending_id)
         print(f'Processing document: {doc_id}')
         try:
             await KnowledgeService.process_document(doc_id)
@@ -88,7 +88,7 @@ export const supportAPI = {
   listEscalations: (orgId, params) => api.get('/support/escalations', {
     params: { organization_id: orgId, ...params }
   }),
-  getEscalation: (escalationId) => api.get(`/support/escalations/${escalationId}`),
+  getEscalation: (escalationId, params) => api.get(`/support/escalations/${escalationId}`, { params }),
   assignEscalation: (escalationId, assignedToId) => api.post(`/support/escalations/${escalationId}/assign`, {
     assigned_to_id: assignedToId
   }),
@@ -131,7 +131,7 @@ export const voiceAPI = {
   synthesize: (text, voice) => api.post('/voice/synthesize', {
     text,
     voice,
-  }),
+  }, { responseType: 'blob' }),
   listVoices: () => api.get('/voice/voices'),
 }
 
@@ -1,8 +1,11 @@
 import { useQuery } from '@tanstack/react-query'
 import { supportAPI } from '../../api/client'
+import { useAuthStore } from '../../stores/authStore'
 import { Link } from 'react-router-dom'
 
 export default function SupportDashboard() {
+  const organizationId = useAuthStore((state) => state.getOrganizationId())
+
   const { data: queueStats, isLoading: loadingQueue } = useQuery({
     queryKey: ['support-queue-stats'],
     queryFn: async () => {
@@ -18,9 +21,18 @@ export default function SupportDashboard() {
     refetchInterval: 10000,
   })
 
+  const { data: escalationStats } = useQuery({
+    queryKey: ['support-escalation-stats', organizationId],
+    queryFn: () => supportAPI.getQueueStats(organizationId),
+    enabled: !!organizationId,
+    refetchInterval: 10000,
+  })
+
+  // Only the first few are shown here; the escalations page pages through the rest
   const { data: escalationsData, isLoading: loadingEscalations } = useQuery({
-    queryKey: ['escalations', 'pending'],
-    queryFn: () => supportAPI.getEscalations('pending'),
+    queryKey: ['escalations', organizationId, 'pending', 'recent'],
+    queryFn: () => supportAPI.listEscalations(organizationId, { status: 'pending', limit: 5 }),
+    enabled: !!organizationId,
     refetchInterval: 10000,
   })
 
@@ -32,7 +44,7 @@ export default function SupportDashboard() {
     },
     {
       name: 'Pending Escalations',
-      value: escalationsData?.data?.length || 0,
+      value: escalationStats?.data?.total_pending || 0,
       link: '/support/escalations',
     },
     {
@@ -100,13 +112,13 @@ export default function SupportDashboard() {
           <div className="flex items-center justify-center h-32">
             <div className="w-5 h-5 border-2 border-brand-600 border-t-transparent rounded-full animate-spin" />
           </div>
-        ) : escalationsData?.data?.length === 0 ? (
+        ) : escalationsData?.data?.items?.length === 0 ? (
           <div className="p-8 text-center">
             <p className="text-sm text-slate-500">No pending escalations</p>
           </div>
         ) : (
           <div className="divide-y divide-slate-100">
-            {escalationsData?.data?.slice(0, 5).map((escalation) => (
+            {escalationsData?.data?.items?.map((escalation) => (
               <div key={escalation.id} className="p-4 hover:bg-slate-50 transition-colors">
                 <div className="flex items-start justify-between">
                   <div className="flex-1">
@@ -1,6 +1,7 @@
 import { useState } from 'react'
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query'
+import { useInfiniteQuery, useMutation, useQueryClient } from '@tanstack/react-query'
 import { supportAPI } from '../../api/client'
+import { useAuthStore } from '../../stores/authStore'
 import { format } from 'date-fns'
 import { Link } from 'react-router-dom'
 
@@ -12,17 +13,46 @@ const statusFilters = [
 
 export default function Escalations() {
   const queryClient = useQueryClient()
+  const organizationId = useAuthStore((state) => state.getOrganizationId())
   const [statusFilter, setStatusFilter] = useState('pending')
   const [searchQuery, setSearchQuery] = useState('')
   const [selectedEscalation, setSelectedEscalation] = useState(null)
   const [resolution, setResolution] = useState('')
 
-  const { data: escalationsData, isLoading } = useQuery({
-    queryKey: ['escalations', statusFilter],
-    queryFn: () => supportAPI.getEscalations(statusFilter),
+  const {
+    data: escalationsData,
+    isLoading,
+    fetchNextPage,
+    hasNextPage,
+    isFetchingNextPage,
+  } = useInfiniteQuery({
+    queryKey: ['escalations', organizationId, statusFilter],
+    queryFn: ({ pageParam }) => supportAPI.listEscalations(organizationId, {
+      status: statusFilter,
+      cursor: pageParam,
+    }),
+    initialPageParam: undefined,
+    getNextPageParam: (lastPage) => lastPage.data.next_cursor ?? undefined,
+    enabled: !!organizationId,
     refetchInterval: statusFilter === 'pending' ? 10000 : false,
   })
 
+  // Messages of the selected escalation's conversation, paged by the API
+  const {
+    data: detailData,
+    fetchNextPage: fetchMoreMessages,
+    hasNextPage: hasMoreMessages,
+    isFetchingNextPage: isFetchingMoreMessages,
+  } = useInfiniteQuery({
+    queryKey: ['escalation', selectedEscalation?.id],
+    queryFn: ({ pageParam }) => supportAPI.getEscalation(selectedEscalation.id, {
+      messages_cursor: pageParam,
+    }),
+    initialPageParam: undefined,
+    getNextPageParam: (lastPage) => lastPage.data.next_messages_cursor ?? undefined,
+    enabled: !!selectedEscalation,
+  })
+
   const resolveMutation = useMutation({
     mutationFn: ({ escalationId, resolution }) =>
       supportAPI.resolveEscalation(escalationId, resolution),
@@ -33,10 +63,15 @@ export default function Escalations() {
     },
   })
 
-  const filteredEscalations = escalationsData?.data?.filter((e) =>
+  const escalations = escalationsData?.pages.flatMap((page) => page.data.items) || []
+  const selectedMessages = detailData?.pages.flatMap(
+    (page) => page.data.conversation?.messages || []
+  ) || []
+
+  const filteredEscalations = escalations.filter((e) =>
     e.reason?.toLowerCase().includes(searchQuery.toLowerCase()) ||
     e.conversation_id?.includes(searchQuery)
-  ) || []
+  )
 
   const getStatusBadge = (status) => {
     const config = statusFilters.find(s => s.value === status) || statusFilters[0]
@@ -133,6 +168,18 @@ export default function Escalations() {
             ))}
           </div>
         )}
+
+        {hasNextPage && (
+          <div className="p-4 border-t border-slate-100 text-center">
+            <button
+              onClick={() => fetchNextPage()}
+              disabled={isFetchingNextPage}
+              className="px-4 py-2 text-sm font-medium text-slate-700 bg-slate-100 rounded-md hover:bg-slate-200 disabled:opacity-50 transition-colors"
+            >
+              {isFetchingNextPage ? 'Loading...' : 'Load more'}
+            </button>
+          </div>
+        )}
       </div>
 
       {/* Resolution Modal */}
@@ -148,6 +195,26 @@ export default function Escalations() {
               <p className="text-sm text-slate-900">{selectedEscalation.reason}</p>
             </div>
 
+            {selectedMessages.length > 0 && (
+              <div className="mb-4 max-h-64 overflow-y-auto space-y-2">
+                {selectedMessages.map((message) => (
+                  <div key={message.id} className="p-2 bg-slate-50 rounded-md">
+                    <p className="text-xs font-medium text-slate-500">{message.role}</p>
+                    <p className="text-sm text-slate-900 whitespace-pre-wrap">{message.content}</p>
+                  </div>
+                ))}
+                {hasMoreMessages && (
+                  <button
+                    onClick={() => fetchMoreMessages()}
+                    disabled={isFetchingMoreMessages}
+                    className="w-full py-1.5 text-xs font-medium text-slate-700 bg-slate-100 rounded-md hover:bg-slate-200 disabled:opacity-50 transition-colors"
+                  >
+                    {isFetchingMoreMessages ? 'Loading...' : 'Load more messages'}
+                  </button>
+                )}
+              </div>
+            )}
+
             <div className="mb-4">
               <label className="block text-xs font-medium text-slate-500 mb-2">
                 Resolution Notes